@@ -50,14 +50,13 @@ Note:
 
 from __future__ import annotations
 
+import importlib
 import os
+from types import ModuleType
 
 __version__ = "0.1.0"
 __all__ = ["bridge", "setup_logging"]
 
-# Re-export bridge module for easy access
-from assassinate import bridge
-
 # Setup logging with default configuration
 # Can be overridden by calling setup_logging() with custom parameters
 from assassinate.logging import setup_logging
@@ -67,4 +66,29 @@ log_level = os.getenv("ASSASSINATE_LOG_LEVEL", "WARNING")
 log_file = os.getenv("ASSASSINATE_LOG_FILE", None)
 setup_logging(level=log_level, log_file=log_file, structured=True)
 
+# Submodules exposed as package attributes, imported on first access so
+# that ``import assassinate`` does not pull in the whole IPC client stack
+_LAZY_SUBMODULES: dict[str, str] = {"bridge": "assassinate.bridge"}
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Resolve lazily-imported submodules (PEP 562).
+
+    Args:
+        name: Attribute name being looked up on the package
+
+    Returns:
+        The imported submodule
+
+    Raises:
+        AttributeError: If name is not a known lazy submodule
+    """
+    target = _LAZY_SUBMODULES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # import_module also binds the submodule on the package, so this hook
+    # only runs once per name
+    return importlib.import_module(target)
+
+
 # Note: High-level API will be added here in future versions
@@ -6,18 +6,14 @@ Use this when you're already in an async context.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
+from assassinate.bridge.datastore import DataStore
+from assassinate.bridge.db import DbManager
+from assassinate.bridge.jobs import JobManager
+from assassinate.bridge.modules import Module
+from assassinate.bridge.payloads import PayloadGenerator
+from assassinate.bridge.sessions import SessionManager
 from assassinate.ipc import MsfClient
 
-if TYPE_CHECKING:
-    from assassinate.bridge.datastore import DataStore
-    from assassinate.bridge.db import DbManager
-    from assassinate.bridge.jobs import JobManager
-    from assassinate.bridge.modules import Module
-    from assassinate.bridge.payloads import PayloadGenerator
-    from assassinate.bridge.sessions import SessionManager
-
 # Global async client - initialized on first use
 _client: MsfClient | None = None
 
@@ -126,8 +122,6 @@ class AsyncFramework:
         Returns:
             Module instance.
         """
-        from assassinate.bridge.modules import Module
-
         client = self._ensure_initialized()
         module_id = await client.create_module(module_name)
         return Module(module_id, client)
@@ -138,8 +132,6 @@ class AsyncFramework:
         Returns:
             Global DataStore instance.
         """
-        from assassinate.bridge.datastore import DataStore
-
         client = self._ensure_initialized()
         return DataStore(client)
 
@@ -149,8 +141,6 @@ class AsyncFramework:
         Returns:
             SessionManager instance.
         """
-        from assassinate.bridge.sessions import SessionManager
-
         client = self._ensure_initialized()
         return SessionManager(client)
 
@@ -160,8 +150,6 @@ class AsyncFramework:
         Returns:
             PayloadGenerator instance.
         """
-        from assassinate.bridge.payloads import PayloadGenerator
-
         client = self._ensure_initialized()
         return PayloadGenerator(client)
 
@@ -171,8 +159,6 @@ class AsyncFramework:
         Returns:
             DbManager instance.
         """
-        from assassinate.bridge.db import DbManager
-
         client = self._ensure_initialized()
         return DbManager(client)
 
@@ -194,8 +180,6 @@ class AsyncFramework:
         Returns:
             JobManager instance.
         """
-        from assassinate.bridge.jobs import JobManager
-
         client = self._ensure_initialized()
         return JobManager(client)
 
@@ -51,7 +51,7 @@ class DbManager:
             >>> print(f"Found {len(hosts)} hosts")
         """
         result = await call_client_method(self._client, "db_hosts")
-        return list(result)
+        return result
 
     async def services(self) -> list[str]:
         """Get all services from the database.
@@ -66,7 +66,7 @@ class DbManager:
             ...     print(svc)
         """
         result = await call_client_method(self._client, "db_services")
-        return list(result)
+        return result
 
     async def report_host(self, **opts: str) -> int:
         """Report a host to the database.
@@ -87,7 +87,7 @@ class DbManager:
             >>> print(f"Reported host with ID: {host_id}")
         """
         result = await call_client_method(self._client, "db_report_host", opts)
-        return int(result)
+        return result
 
     async def report_service(self, **opts: str) -> int:
         """Report a service to the database.
@@ -111,7 +111,7 @@ class DbManager:
         result = await call_client_method(
             self._client, "db_report_service", opts
         )
-        return int(result)
+        return result
 
     async def report_vuln(self, **opts: str) -> int:
         """Report a vulnerability to the database.
@@ -134,7 +134,7 @@ class DbManager:
             >>> print(f"Reported vulnerability with ID: {vuln_id}")
         """
         result = await call_client_method(self._client, "db_report_vuln", opts)
-        return int(result)
+        return result
 
     async def report_cred(self, **opts: str) -> int:
         """Report a credential to the database.
@@ -158,7 +158,7 @@ class DbManager:
             >>> print(f"Reported credential with ID: {cred_id}")
         """
         result = await call_client_method(self._client, "db_report_cred", opts)
-        return int(result)
+        return result
 
     async def vulns(self) -> list[str]:
         """Get all vulnerabilities from the database.
@@ -172,7 +172,7 @@ class DbManager:
             >>> print(f"Found {len(vulns)} vulnerabilities")
         """
         result = await call_client_method(self._client, "db_vulns")
-        return list(result)
+        return result
 
     async def creds(self) -> list[str]:
         """Get all credentials from the database.
@@ -187,7 +187,7 @@ class DbManager:
             ...     print(cred)
         """
         result = await call_client_method(self._client, "db_creds")
-        return list(result)
+        return result
 
     async def loot(self) -> list[str]:
         """Get all loot from the database.
@@ -201,7 +201,7 @@ class DbManager:
             >>> print(f"Found {len(loot)} loot items")
         """
         result = await call_client_method(self._client, "db_loot")
-        return list(result)
+        return result
 
     def __repr__(self) -> str:
         """Return string representation of DbManager.
@@ -49,7 +49,7 @@ class JobManager:
             >>> print(f"Active jobs: {len(job_ids)}")
         """
         result = await call_client_method(self._client, "job_list")
-        return list(result)
+        return result
 
     async def get(self, job_id: str) -> str | None:
         """Get job information by ID.
@@ -67,7 +67,7 @@ class JobManager:
             ...     print(job)
         """
         result = await call_client_method(self._client, "job_get", job_id)
-        return str(result) if result is not None else None
+        return result
 
     async def kill(self, job_id: str) -> bool:
         """Kill a job by ID.
@@ -84,7 +84,7 @@ class JobManager:
             ...     print("Job killed")
         """
         result = await call_client_method(self._client, "job_kill", job_id)
-        return bool(result)
+        return result
 
     def __repr__(self) -> str:
         """Return string representation of JobManager.
@@ -126,7 +126,7 @@ class PayloadGenerator:
             Available payloads: 1680
         """
         result = await call_client_method(self._client, "payload_list_payloads")
-        return list(result)
+        return result
 
     async def generate_executable(
         self,
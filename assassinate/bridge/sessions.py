@@ -36,6 +36,8 @@ class SessionManager:
     Provides access to established sessions from successful exploits.
     """
 
+    __slots__ = ("_client",)
+
     _client: ClientProtocol
 
     def __init__(self, client: ClientProtocol) -> None:
@@ -123,10 +125,12 @@ class Session:
     meterpreter, or other session type.
 
     Note:
-        Most session interaction methods require daemon support and are
-        not yet implemented in the IPC layer.
+        kill() and execute() require daemon support and are not yet
+        implemented in the IPC layer.
     """
 
+    __slots__ = ("_session_id", "_client")
+
     _session_id: int
     _client: ClientProtocol
 
@@ -157,16 +161,15 @@ class Session:
 
         Returns:
             True if session is active.
-
-        Note:
-            This method requires daemon support - not yet implemented.
-            Currently returns True if session ID exists.
         """
-        # TODO: Add session_alive IPC method to daemon
-        # For now, just check if session is still in the list
+        # Ask about this session directly rather than transferring the
+        # whole session list and scanning it
         try:
-            manager = SessionManager(self._client)
-            return self._session_id in manager.list()
+            return _run_async(
+                call_client_method(
+                    self._client, "session_alive", self._session_id
+                )
+            )
         except Exception:
             return False
 
@@ -210,34 +213,44 @@ class Session:
 
         Returns:
             Number of bytes written.
-
-        Note:
-            This method requires daemon support - not yet implemented.
-
-        Raises:
-            NotImplementedError: Method not yet supported via IPC.
         """
-        raise NotImplementedError(
-            "Session.write() requires daemon support (not yet implemented)"
+        return _run_async(
+            call_client_method(
+                self._client, "session_write", self._session_id, data
+            )
         )
 
     def read(self, length: int | None = None) -> str:
         """Read data from the session.
 
+        Convenience wrapper that returns text. Use read_bytes() for
+        binary sessions such as meterpreter.
+
         Args:
             length: Number of bytes to read (None = all available).
 
         Returns:
             Data read from session.
+        """
+        return _run_async(
+            call_client_method(
+                self._client, "session_read", self._session_id, length
+            )
+        )
 
-        Note:
-            This method requires daemon support - not yet implemented.
+    def read_bytes(self, length: int | None = None) -> bytes:
+        """Read raw bytes from the session.
 
-        Raises:
-            NotImplementedError: Method not yet supported via IPC.
+        Args:
+            length: Number of bytes to read (None = all available).
+
+        Returns:
+            Bytes read from session, without any UTF-8 decoding.
         """
-        raise NotImplementedError(
-            "Session.read() requires daemon support (not yet implemented)"
+        return _run_async(
+            call_client_method(
+                self._client, "session_read_bytes", self._session_id, length
+            )
         )
 
     def __repr__(self) -> str:
@@ -8,29 +8,45 @@ Use this when you're in synchronous code and don't want to manage async/await.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
+import functools
+import threading
+import time
+
+from assassinate.bridge.datastore import DataStore
+from assassinate.bridge.db import DbManager
+from assassinate.bridge.jobs import JobManager
+from assassinate.bridge.modules import Module
+from assassinate.bridge.payloads import PayloadGenerator
+from assassinate.bridge.sessions import SessionManager
 from assassinate.ipc.sync import SyncMsfClient
 
-if TYPE_CHECKING:
-    from assassinate.bridge.datastore import DataStore
-    from assassinate.bridge.db import DbManager
-    from assassinate.bridge.jobs import JobManager
-    from assassinate.bridge.modules import Module
-    from assassinate.bridge.payloads import PayloadGenerator
-    from assassinate.bridge.sessions import SessionManager
-
 # Global sync client - initialized on first use
 _client: SyncMsfClient | None = None
 
+# Serializes first-use connection so two threads that both find no client
+# do not each connect one
+_connect_lock = threading.Lock()
+
+# Seconds a threads() result may be reused by threads_enabled()
+THREADS_CACHE_TTL = 1.0
+
 
 def get_client() -> SyncMsfClient:
-    """Get or create the global sync IPC client."""
+    """Get or create the global sync IPC client.
+
+    Once connected the client is returned without taking the lock. A
+    failed connect is not cached and will be retried on the next call.
+    """
     global _client
-    if _client is None:
-        _client = SyncMsfClient()
-        _client.connect()
-    return _client
+    client = _client
+    if client is None:
+        with _connect_lock:
+            if _client is None:
+                client = SyncMsfClient()
+                client.connect()
+                _client = client
+            client = _client
+    return client
 
 
 def initialize(msf_path: str | None = None) -> None:
@@ -51,9 +67,14 @@ def initialize(msf_path: str | None = None) -> None:
     get_client()
 
 
+@functools.cache
 def get_version() -> str:
     """Get Metasploit Framework version string.
 
+    The version is fixed for the lifetime of the daemon, so it is fetched
+    once and memoized. Call ``get_version.cache_clear()`` after pointing
+    the client at a different daemon.
+
     Returns:
         MSF version (e.g., "6.4.28-dev").
 
@@ -84,6 +105,9 @@ class Framework:
     """
 
     _client: SyncMsfClient
+    _threads_cache: tuple[float, int] | None
+    _catalog_version: int | None
+    _list_cache: dict[str, list[str]]
 
     def __init__(self) -> None:
         """Initialize Framework instance.
@@ -91,26 +115,53 @@ class Framework:
         The client connects automatically on first use.
         """
         self._client = get_client()
+        # (monotonic timestamp, thread count) from the last threads() call
+        self._threads_cache = None
+        # list_modules() results, valid while the daemon's catalog version
+        # matches _catalog_version
+        self._catalog_version = None
+        self._list_cache = {}
+
+    @functools.cached_property
+    def _version(self) -> str:
+        """MSF version, fetched over IPC on first access only."""
+        result = self._client.framework_version()
+        return result.get("version", "unknown")
 
     def version(self) -> str:
         """Get MSF version.
 
+        The daemon's version cannot change while it is running, so the
+        result is cached on the instance after the first round-trip.
+
         Returns:
             Version string (e.g., "6.4.28-dev").
         """
-        result = self._client.framework_version()
-        return result.get("version", "unknown")
+        return self._version
 
     def list_modules(self, module_type: str) -> list[str]:
         """List all modules of a given type.
 
+        Results are cached per module type and dropped when the daemon's
+        module catalog version changes. The returned list is shared
+        between calls, so copy it before mutating.
+
         Args:
             module_type: Type of modules to list (exploit, auxiliary, etc.)
 
         Returns:
             List of module names.
         """
-        return self._client.list_modules(module_type)
+        version = self._client.module_catalog_version()
+        if version != self._catalog_version:
+            self._list_cache.clear()
+            self._catalog_version = version
+
+        modules = self._list_cache.get(module_type)
+        if modules is None:
+            modules = self._client.list_modules(module_type)
+            self._list_cache[module_type] = modules
+        return modules
 
     def create_module(self, module_name: str) -> Module:
         """Create a module instance by name.
@@ -132,8 +183,6 @@ class Framework:
             >>> # Module methods are async - use await
             >>> name = asyncio.run(mod.name())
         """
-        from assassinate.bridge.modules import Module
-
         module_id = self._client.create_module(module_name)
         return Module(module_id, self._client)
 
@@ -151,8 +200,6 @@ class Framework:
         Returns:
             Global DataStore instance.
         """
-        from assassinate.bridge.datastore import DataStore
-
         return DataStore(self._client)
 
     def sessions(self) -> SessionManager:
@@ -161,8 +208,6 @@ class Framework:
         Returns:
             SessionManager instance.
         """
-        from assassinate.bridge.sessions import SessionManager
-
         return SessionManager(self._client)
 
     def payload_generator(self) -> PayloadGenerator:
@@ -171,8 +216,6 @@ class Framework:
         Returns:
             PayloadGenerator instance.
         """
-        from assassinate.bridge.payloads import PayloadGenerator
-
         return PayloadGenerator(self._client)
 
     def db(self) -> DbManager:
@@ -181,8 +224,6 @@ class Framework:
         Returns:
             DbManager instance.
         """
-        from assassinate.bridge.db import DbManager
-
         return DbManager(self._client)
 
     def search(self, query: str) -> list[str]:
@@ -202,8 +243,6 @@ class Framework:
         Returns:
             JobManager instance.
         """
-        from assassinate.bridge.jobs import JobManager
-
         return JobManager(self._client)
 
     def threads(self) -> int:
@@ -212,16 +251,25 @@ class Framework:
         Returns:
             Number of threads configured.
         """
-        return self._client.threads()
+        threads = self._client.threads()
+        self._threads_cache = (time.monotonic(), threads)
+        return threads
 
     def threads_enabled(self) -> bool:
         """Check if framework has threads configured.
 
+        Reuses the count from a threads() call made within the last
+        THREADS_CACHE_TTL seconds instead of issuing another round-trip.
+
         Returns:
             True if threads are enabled.
         """
-        threads = self._client.threads()
-        return threads > 0
+        cached = self._threads_cache
+        if cached is not None and (
+            time.monotonic() - cached[0] < THREADS_CACHE_TTL
+        ):
+            return cached[1] > 0
+        return self.threads() > 0
 
     def __repr__(self) -> str:
         """Return string representation."""
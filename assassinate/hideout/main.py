@@ -1,3 +1,5 @@
+import sys
+
 from assassinate.bridge import Framework, get_version, initialize
 
 
@@ -25,8 +27,7 @@ def main():
 
     # Show first 5 exploits
     print("Sample exploits:")  # noqa: T201
-    for exploit in exploits[:5]:
-        print(f"  - {exploit}")  # noqa: T201
+    sys.stdout.write("".join(f"  - {exploit}\n" for exploit in exploits[:5]))
     print()  # noqa: T201
 
 
@@ -3,15 +3,152 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import itertools
+import logging
+import os
+import struct
+import time
+from collections.abc import Iterable, Sequence
 from typing import Any
 
-from assassinate.ipc.errors import BufferEmptyError, RemoteError, TimeoutError
-from assassinate.ipc.protocol import deserialize_response, serialize_call
-from assassinate.ipc.shm import RingBuffer
+import msgspec
+
+from assassinate.ipc.errors import (
+    BufferEmptyError,
+    ConnectionError,
+    DeserializationError,
+    RemoteError,
+    TimeoutError,
+)
+from assassinate.ipc.protocol import (
+    deserialize_response,
+    serialize_call_into,
+)
+from assassinate.ipc.shm import Doorbell, RingBuffer
 from assassinate.logging import PerformanceLogger, current_call_id, get_logger
 
 logger = get_logger("ipc.client")
 
+# Environment variable naming CPUs to pin the event loop thread to when no
+# cpu_affinity is passed, e.g. "3" or "2,3"
+CPU_AFFINITY_ENV = "ASSASSINATE_IPC_CPU"
+
+
+def _cpu_affinity_from_env() -> frozenset[int] | None:
+    """Read the default CPU affinity from ``ASSASSINATE_IPC_CPU``.
+
+    Returns:
+        The CPUs listed in the variable, or None if it is unset or invalid
+    """
+    value = os.getenv(CPU_AFFINITY_ENV)
+    if not value:
+        return None
+    try:
+        return frozenset(int(cpu) for cpu in value.split(","))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {CPU_AFFINITY_ENV}={value!r}")
+        return None
+
+
+# Result shapes for calls that only read a field or two. Decoding into these
+# skips building a dict for the whole result.
+
+
+class _ModulesResult(msgspec.Struct):
+    modules: list[str] = []
+
+
+class _CatalogVersionResult(msgspec.Struct):
+    version: int
+
+
+class _SearchResult(msgspec.Struct):
+    results: list[str] = []
+
+
+class _ThreadsResult(msgspec.Struct):
+    threads: int = 0
+
+
+class _SessionIdsResult(msgspec.Struct):
+    session_ids: list[int] = []
+
+
+class _ValueResult(msgspec.Struct):
+    value: Any = None
+
+
+class _SessionIdResult(msgspec.Struct):
+    session_id: int | None = None
+
+
+class _HostsResult(msgspec.Struct):
+    hosts: list[str]
+
+
+class _ServicesResult(msgspec.Struct):
+    services: list[str]
+
+
+class _VulnsResult(msgspec.Struct):
+    vulns: list[str]
+
+
+class _CredsResult(msgspec.Struct):
+    creds: list[str]
+
+
+class _LootResult(msgspec.Struct):
+    loot: list[str]
+
+
+class _JobIdsResult(msgspec.Struct):
+    job_ids: list[str]
+
+
+class _PluginsResult(msgspec.Struct):
+    plugins: list[str]
+
+
+# Returned by MsfClient._poll_reply when the response has not arrived yet
+_NO_REPLY = object()
+
+# Stands in for PerformanceLogger in _call when debug logging is off
+_NO_TRACKING = contextlib.nullcontext()
+
+# Length header of a framed request (u32, little-endian)
+_FRAME_HEADER = struct.Struct("<I")
+
+
+def _append_request(
+    frames: bytearray, call_id: int, method: str, args: Sequence[Any]
+) -> None:
+    """Append one length-prefixed request to a block of framed requests.
+
+    If the request cannot be serialized the block is left as it was, so
+    frames already in it are still sent intact.
+    """
+    start = len(frames)
+    try:
+        serialize_call_into(
+            frames, call_id, method, args, start + RingBuffer.HEADER_SIZE
+        )
+    except Exception:
+        del frames[start:]
+        raise
+    _FRAME_HEADER.pack_into(
+        frames, start, len(frames) - start - RingBuffer.HEADER_SIZE
+    )
+
+
+def _expire_call(*futures: asyncio.Future) -> None:
+    """Fail calls that are still waiting for their responses."""
+    for future in futures:
+        if not future.done():
+            future.set_exception(asyncio.TimeoutError())
+
 
 class MsfClient:
     """Async client for communicating with MSF daemon via IPC.
@@ -25,28 +162,86 @@ class MsfClient:
             print(f"MSF Version: {version}")
     """
 
+    __slots__ = (
+        "shm_name",
+        "buffer_size",
+        "cpu_affinity",
+        "request_buffer",
+        "response_buffer",
+        "_next_call_id",
+        "_request_frame",
+        "_queued_frames",
+        "_queued_calls",
+        "_pending_calls",
+        "_result_types",
+        "_decode_response",
+        "_response_reader_task",
+        "_shutdown",
+        "_doorbell",
+        "_response_ready",
+    )
+
     DEFAULT_SHM_NAME = "/assassinate_msf_ipc"
     DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024  # 8 MB (optimized from 64MB)
+    # Empty polls that just yield to the event loop before the response
+    # reader falls back to sleeping between polls; the sleep then doubles
+    # from READER_IDLE_SLEEP_MIN up to READER_IDLE_SLEEP_MAX
+    READER_IDLE_SPINS = 100
+    READER_IDLE_SLEEP_MIN = 1e-5
+    READER_IDLE_SLEEP_MAX = 0.002
+    # How long the reader busy-polls the ring, without yielding, when it
+    # first finds it empty while calls are in flight
+    READER_BUSY_POLL = 20e-6
+    # Responses the reader routes back to back before yielding to the
+    # event loop, so a flood of replies cannot starve other tasks
+    READER_MAX_BATCH = 256
 
     def __init__(
         self,
         shm_name: str = DEFAULT_SHM_NAME,
         buffer_size: int = DEFAULT_BUFFER_SIZE,
+        cpu_affinity: Iterable[int] | None = None,
     ):
         """Initialize the IPC client.
 
         Args:
             shm_name: Shared memory name (must match daemon)
             buffer_size: Ring buffer size (must match daemon)
+            cpu_affinity: CPUs to pin the thread that calls connect() to.
+                Picking cores that share a cache with the daemon's keeps
+                the ring's cursor cache lines from bouncing across sockets.
+                Defaults to the comma-separated CPU list in the
+                ``ASSASSINATE_IPC_CPU`` environment variable; if that is
+                unset the thread is not pinned.
         """
         self.shm_name = shm_name
         self.buffer_size = buffer_size
+        self.cpu_affinity = (
+            frozenset(cpu_affinity)
+            if cpu_affinity is not None
+            else _cpu_affinity_from_env()
+        )
         self.request_buffer: RingBuffer | None = None  # Client writes requests
         self.response_buffer: RingBuffer | None = None  # Client reads responses
-        self.next_call_id = 1
+        # Bound counter method: one C call per ID, no read-modify-write
+        self._next_call_id = itertools.count(1).__next__
+        # Scratch buffer requests are framed in before being copied into
+        # the ring; reused so each call does not allocate a new message
+        self._request_frame = bytearray(RingBuffer.HEADER_SIZE)
+        # Requests from concurrent calls waiting for the next flush
+        self._queued_frames = bytearray()
+        self._queued_calls: list[int] = []
         self._pending_calls: dict[int, asyncio.Future] = {}
+        # Result types of in-flight calls that asked for typed decoding
+        self._result_types: dict[int, Any] = {}
+        self._decode_response = functools.partial(
+            deserialize_response, result_types=self._result_types
+        )
         self._response_reader_task: asyncio.Task | None = None
         self._shutdown = False
+        # Set when the daemon rings the response doorbell
+        self._doorbell: Doorbell | None = None
+        self._response_ready = asyncio.Event()
 
     async def connect(self) -> None:
         """Connect to the daemon's shared memory."""
@@ -66,6 +261,18 @@ class MsfClient:
             logger.debug(f"Opening response buffer: {response_name}")
             self.response_buffer = RingBuffer(response_name, self.buffer_size)
 
+            try:
+                self._doorbell = Doorbell(response_name)
+            except OSError:
+                logger.debug("No response doorbell, polling response buffer")
+            else:
+                asyncio.get_running_loop().add_reader(
+                    self._doorbell.fileno(), self._on_doorbell
+                )
+
+            if self.cpu_affinity is not None:
+                self._pin_thread(self.cpu_affinity)
+
             # Start background response reader task
             self._shutdown = False
             self._response_reader_task = asyncio.create_task(
@@ -77,12 +284,30 @@ class MsfClient:
             logger.error(f"Failed to connect to daemon: {e}")
             raise
 
+    @staticmethod
+    def _pin_thread(cpus: frozenset[int]) -> None:
+        """Pin the calling thread, which runs the event loop, to CPUs.
+
+        Pinning is a tuning hint, so failure is logged rather than raised.
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("CPU affinity is not supported on this platform")
+            return
+        try:
+            # pid 0 is the calling thread on Linux
+            os.sched_setaffinity(0, cpus)
+        except OSError as e:
+            logger.warning(f"Failed to pin to CPUs {sorted(cpus)}: {e}")
+        else:
+            logger.debug(f"Pinned event loop thread to CPUs {sorted(cpus)}")
+
     async def disconnect(self) -> None:
         """Disconnect from shared memory."""
         logger.info("Disconnecting from daemon")
 
         # Signal shutdown and wait for response reader to finish
         self._shutdown = True
+        self._response_ready.set()
         if self._response_reader_task:
             try:
                 await asyncio.wait_for(self._response_reader_task, timeout=2.0)
@@ -94,6 +319,16 @@ class MsfClient:
                     await self._response_reader_task
                 except asyncio.CancelledError:
                     pass
+            self._response_reader_task = None
+        self._close_doorbell()
+
+        # Nothing will answer calls that are still waiting
+        for future in self._pending_calls.values():
+            if not future.done():
+                future.set_exception(
+                    ConnectionError("Disconnected before response arrived")
+                )
+        self._pending_calls.clear()
 
         if self.request_buffer:
             self.request_buffer.close()
@@ -113,39 +348,78 @@ class MsfClient:
         """Async context manager exit."""
         await self.disconnect()
 
+    def _on_doorbell(self) -> None:
+        """Event loop callback for a readable response doorbell."""
+        if self._doorbell is not None and not self._doorbell.drain():
+            # Daemon closed its end; fall back to polling
+            logger.warning("Response doorbell closed, polling response buffer")
+            self._close_doorbell()
+        self._response_ready.set()
+
+    def _close_doorbell(self) -> None:
+        """Unregister and close the response doorbell, if any."""
+        if self._doorbell is not None:
+            asyncio.get_running_loop().remove_reader(self._doorbell.fileno())
+            self._doorbell.close()
+            self._doorbell = None
+
     async def _response_reader(self) -> None:
         """Background task that reads responses and routes to calls.
 
         This ensures responses are never lost, even if they arrive out of order.
+        When the daemon provides a response doorbell the task waits on it
+        while the buffer is empty. Otherwise it only yields to the event loop
+        between polls after a response, so back-to-back calls are picked up
+        without a fixed sleep; once the buffer has stayed empty for
+        READER_IDLE_SPINS polls it sleeps between polls, backing off
+        exponentially up to READER_IDLE_SLEEP_MAX to avoid spinning while
+        idle.
+
+        In either mode, the first time the buffer is found empty while calls
+        are in flight it is busy-polled for READER_BUSY_POLL seconds first,
+        so a fast daemon reply is picked up without an event loop round trip.
+
+        Each wake drains every waiting response without yielding in between,
+        up to READER_MAX_BATCH at a time.
         """
         logger.debug("Response reader task started")
+        idle_polls = 0
+        idle_sleep = self.READER_IDLE_SLEEP_MIN
+        batch = 0
+
+        # Bind the per-response lookups once; the buffer and the pending
+        # call table outlive this task
+        response_buffer = self.response_buffer
+        if response_buffer is None:
+            return
+        read_response = response_buffer.read_zero_copy
+        decode = self._decode_response
+        pop_pending = self._pending_calls.pop
 
         while not self._shutdown:
             try:
-                # Try to read a response from the buffer
-                if not self.response_buffer:
-                    await asyncio.sleep(0.001)
-                    continue
-
-                response_bytes = self.response_buffer.try_read()
-                response_call_id, result, error = deserialize_response(
-                    response_bytes
-                )
+                # Decode straight out of shared memory; the decoder copies out
+                # only the decoded values
+                response_call_id, result, error = read_response(decode)
+                idle_polls = 0
+                idle_sleep = self.READER_IDLE_SLEEP_MIN
+                batch += 1
 
                 # Find the pending call for this response
-                future = self._pending_calls.pop(response_call_id, None)
+                future = pop_pending(response_call_id, None)
                 if future and not future.cancelled():
                     if error:
                         logger.debug(
-                            f"Call {response_call_id} returned error: "
-                            f"{error['code']}"
+                            "Call %s returned error: %s",
+                            response_call_id,
+                            error["code"],
                         )
                         future.set_exception(
                             RemoteError(error["code"], error["message"])
                         )
                     else:
                         logger.debug(
-                            f"Call {response_call_id} completed successfully"
+                            "Call %s completed successfully", response_call_id
                         )
                         future.set_result(result)
                 elif not future:
@@ -156,9 +430,39 @@ class MsfClient:
                 # If no pending call found, the response is silently dropped
                 # (this could happen if a call timed out)
 
+                if batch >= self.READER_MAX_BATCH:
+                    batch = 0
+                    await asyncio.sleep(0)
+
             except BufferEmptyError:
-                # No data available - sleep briefly
-                await asyncio.sleep(0.001)  # 1ms
+                batch = 0
+                # No data available - spin briefly if a reply is due, then
+                # wait for the doorbell if there is one, otherwise yield
+                # first and then back off
+                if idle_polls == 0 and self._pending_calls:
+                    idle_polls = 1
+                    if self._busy_poll(response_buffer):
+                        continue
+                if self._doorbell is not None:
+                    self._response_ready.clear()
+                    # A response may have landed since the empty read
+                    if response_buffer.is_empty() and not self._shutdown:
+                        await self._response_ready.wait()
+                elif idle_polls < self.READER_IDLE_SPINS:
+                    idle_polls += 1
+                    await asyncio.sleep(0)
+                else:
+                    await asyncio.sleep(idle_sleep)
+                    idle_sleep = min(idle_sleep * 2, self.READER_IDLE_SLEEP_MAX)
+            except DeserializationError as e:
+                # A result that did not match its type fails only its call
+                future = None
+                if e.call_id is not None:
+                    future = pop_pending(e.call_id, None)
+                if future and not future.cancelled():
+                    future.set_exception(e)
+                else:
+                    logger.error(f"Error in response reader: {e}")
             except Exception as e:
                 # Log unexpected errors but keep running
                 logger.error(f"Error in response reader: {e}", exc_info=True)
@@ -166,13 +470,103 @@ class MsfClient:
 
         logger.debug("Response reader task stopped")
 
-    async def _call(self, method: str, *args: Any, timeout: float = 5.0) -> Any:
+    def _busy_poll(self, response_buffer: RingBuffer) -> bool:
+        """Spin on the response buffer for up to READER_BUSY_POLL seconds.
+
+        Args:
+            response_buffer: The connected response buffer
+
+        Returns:
+            True if a response arrived while spinning
+        """
+        deadline = time.perf_counter() + self.READER_BUSY_POLL
+        while time.perf_counter() < deadline:
+            if not response_buffer.is_empty():
+                return True
+        return False
+
+    def _poll_reply(self, call_id: int, response_buffer: RingBuffer) -> Any:
+        """Spin briefly for the response to a call nothing else waits on.
+
+        Only valid while no other call is in flight, so that the next
+        response in the buffer can only belong to this call (or to one that
+        already timed out).
+
+        Args:
+            call_id: ID of the call that was just sent
+            response_buffer: The connected response buffer
+
+        Returns:
+            The call's result, or _NO_REPLY if it did not arrive within
+            READER_BUSY_POLL seconds
+
+        Raises:
+            RemoteError: If daemon returns an error
+        """
+        if not self._busy_poll(response_buffer):
+            return _NO_REPLY
+
+        response_call_id, result, error = response_buffer.read_zero_copy(
+            self._decode_response
+        )
+        if response_call_id != call_id:
+            logger.warning(
+                f"Received response for unknown "
+                f"call_id={response_call_id} (possibly timed out)"
+            )
+            return _NO_REPLY
+        if error:
+            raise RemoteError(error["code"], error["message"])
+        return result
+
+    def _queue_request(
+        self, call_id: int, method: str, args: Sequence[Any]
+    ) -> None:
+        """Queue a request for the next flush of the request buffer.
+
+        The first request queued in a loop tick schedules the flush, so a
+        burst of concurrent calls reaches the ring in a single write.
+        """
+        _append_request(self._queued_frames, call_id, method, args)
+        if not self._queued_calls:
+            asyncio.get_running_loop().call_soon(self._flush_requests)
+        self._queued_calls.append(call_id)
+
+    def _flush_requests(self) -> None:
+        """Write all queued requests to the request buffer at once.
+
+        If the write fails, the queued calls fail with the same error
+        instead of waiting for responses that will never come.
+        """
+        frames, call_ids = self._queued_frames, self._queued_calls
+        try:
+            if self.request_buffer is not None:
+                self.request_buffer.try_write_frames(frames)
+        except Exception as e:
+            for call_id in call_ids:
+                future = self._pending_calls.pop(call_id, None)
+                if future and not future.done():
+                    future.set_exception(e)
+        finally:
+            del frames[:]
+            call_ids.clear()
+
+    async def _call(
+        self,
+        method: str,
+        *args: Any,
+        timeout: float = 5.0,
+        result_type: Any = None,
+    ) -> Any:
         """Make an RPC call to the daemon.
 
         Args:
             method: Method name to call
             *args: Method arguments
             timeout: Timeout in seconds
+            result_type: Type to decode the result into, e.g. a
+                msgspec.Struct declaring just the fields the caller reads.
+                By default the result is decoded as plain containers.
 
         Returns:
             Method result
@@ -180,37 +574,68 @@ class MsfClient:
         Raises:
             TimeoutError: If call times out
             RemoteError: If daemon returns an error
+            ConnectionError: If the client disconnects while waiting
+            DeserializationError: If the result does not match result_type
         """
         if not self.request_buffer or not self.response_buffer:
             raise RuntimeError("Not connected - call connect() first")
 
         # Generate call ID
-        call_id = self.next_call_id
-        self.next_call_id += 1
+        call_id = self._next_call_id()
 
         # Set context for logging
         current_call_id.set(call_id)
 
-        # Log the call with performance tracking
-        args_summary = f"{len(args)} args" if args else "no args"
-        logger.debug(f"Calling {method}({args_summary}) timeout={timeout}s")
+        # Log the call with performance tracking, only paying for the
+        # messages and timing when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            args_summary = f"{len(args)} args" if args else "no args"
+            logger.debug(f"Calling {method}({args_summary}) timeout={timeout}s")
+            tracker: contextlib.AbstractContextManager[Any] = PerformanceLogger(
+                logger, f"RPC {method}", call_id=call_id
+            )
+        else:
+            tracker = _NO_TRACKING
 
-        # Create a future for this call
-        loop = asyncio.get_event_loop()
-        future: asyncio.Future = loop.create_future()
-        self._pending_calls[call_id] = future
+        if result_type is not None:
+            self._result_types[call_id] = result_type
 
         try:
-            with PerformanceLogger(logger, f"RPC {method}", call_id=call_id):
-                # Serialize and send request
-                request_bytes = serialize_call(call_id, method, list(args))
-                self.request_buffer.try_write(request_bytes)
-
-                # Wait for response with timeout
-                # The response_reader task will set the result or exception
-                result = await asyncio.wait_for(future, timeout=timeout)
-
-            logger.info(f"Call {method} succeeded")
+            with tracker:
+                if self._pending_calls:
+                    # Other calls are in flight, so this one waits on the
+                    # reader anyway: queue the request and let one flush per
+                    # loop tick write everything queued in the meantime
+                    self._queue_request(call_id, method, args)
+                    result = _NO_REPLY
+                else:
+                    # Serialize behind the length header and send request
+                    frame = self._request_frame
+                    serialize_call_into(
+                        frame, call_id, method, args, RingBuffer.HEADER_SIZE
+                    )
+                    self.request_buffer.try_write_frame(frame)
+
+                    # Fast path: with no other call in flight the next
+                    # response is ours, so spin briefly for it before paying
+                    # for a future and a round trip through the reader
+                    result = self._poll_reply(call_id, self.response_buffer)
+
+                if result is _NO_REPLY:
+                    # Wait for response with timeout
+                    # The response_reader task will set the result or
+                    # exception; a loop timer fails the future if it fires
+                    # first
+                    loop = asyncio.get_running_loop()
+                    future: asyncio.Future = loop.create_future()
+                    self._pending_calls[call_id] = future
+                    timer = loop.call_later(timeout, _expire_call, future)
+                    try:
+                        result = await future
+                    finally:
+                        timer.cancel()
+
+            logger.info("Call %s succeeded", method)
             return result
 
         except asyncio.TimeoutError:
@@ -229,9 +654,72 @@ class MsfClient:
             logger.error(f"Call {method} failed: {e}")
             raise
         finally:
+            if result_type is not None:
+                self._result_types.pop(call_id, None)
             # Clear context
             current_call_id.set(None)
 
+    async def call_many(
+        self,
+        calls: Sequence[tuple[str, Sequence[Any]]],
+        timeout: float = 5.0,
+    ) -> list[Any]:
+        """Make several RPC calls in one batch.
+
+        All requests are written to the ring buffer with a single write, so
+        the daemon can work through them back to back instead of waiting for
+        each caller to issue the next one.
+
+        Args:
+            calls: (method, args) pairs to call, in order
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            Results in the same order as calls
+
+        Raises:
+            TimeoutError: If the batch times out
+            RemoteError: If the daemon returns an error for any call
+            ConnectionError: If the client disconnects while waiting
+        """
+        if not self.request_buffer or not self.response_buffer:
+            raise RuntimeError("Not connected - call connect() first")
+
+        loop = asyncio.get_running_loop()
+        call_ids = [self._next_call_id() for _ in calls]
+
+        logger.debug(f"Calling batch of {len(calls)} timeout={timeout}s")
+
+        futures = []
+        for call_id in call_ids:
+            future: asyncio.Future = loop.create_future()
+            self._pending_calls[call_id] = future
+            futures.append(future)
+
+        try:
+            with PerformanceLogger(logger, f"RPC batch of {len(calls)}"):
+                # Frame every request back to back in the reused scratch
+                # buffer and hand the whole batch over in one copy
+                frames = self._request_frame
+                del frames[:]
+                for call_id, (method, args) in zip(call_ids, calls):
+                    _append_request(frames, call_id, method, args)
+                self.request_buffer.try_write_frames(frames)
+                timer = loop.call_later(timeout, _expire_call, *futures)
+                try:
+                    return await asyncio.gather(*futures)
+                finally:
+                    timer.cancel()
+        except asyncio.TimeoutError:
+            logger.error(f"Batch of {len(calls)} timed out after {timeout}s")
+            raise TimeoutError(
+                f"Batch of {len(calls)} calls timed out after {timeout}s"
+            )
+        finally:
+            for call_id, future in zip(call_ids, futures):
+                self._pending_calls.pop(call_id, None)
+                future.cancel()
+
     # MSF API Methods
 
     async def framework_version(self) -> dict[str, str]:
@@ -252,8 +740,24 @@ class MsfClient:
         Returns:
             List of module names
         """
-        result = await self._call("list_modules", module_type)
-        return result.get("modules", [])
+        result = await self._call(
+            "list_modules", module_type, result_type=_ModulesResult
+        )
+        return result.modules
+
+    async def module_catalog_version(self) -> int:
+        """Get the module catalog version.
+
+        The daemon bumps this counter whenever the set of loaded modules
+        may have changed, so callers can cache list_modules() results.
+
+        Returns:
+            Catalog version counter
+        """
+        result = await self._call(
+            "module_catalog_version", result_type=_CatalogVersionResult
+        )
+        return result.version
 
     async def search(self, query: str) -> list[str]:
         """Search for modules matching a query.
@@ -264,8 +768,8 @@ class MsfClient:
         Returns:
             List of matching module names
         """
-        result = await self._call("search", query)
-        return result.get("results", [])
+        result = await self._call("search", query, result_type=_SearchResult)
+        return result.results
 
     async def get_module_info(self, module_name: str) -> dict[str, Any]:
         """Get detailed information about a module.
@@ -284,8 +788,8 @@ class MsfClient:
         Returns:
             Number of threads
         """
-        result = await self._call("threads")
-        return result.get("threads", 0)
+        result = await self._call("threads", result_type=_ThreadsResult)
+        return result.threads
 
     async def list_sessions(self) -> list[int]:
         """List all active session IDs.
@@ -293,8 +797,10 @@ class MsfClient:
         Returns:
             List of session IDs
         """
-        result = await self._call("list_sessions")
-        return result.get("session_ids", [])
+        result = await self._call(
+            "list_sessions", result_type=_SessionIdsResult
+        )
+        return result.session_ids
 
     # Module Management
 
@@ -323,6 +829,21 @@ class MsfClient:
         """
         return await self._call("module_info", module_id)
 
+    async def module_info_many(
+        self, module_ids: Sequence[str]
+    ) -> list[dict[str, Any]]:
+        """Get metadata for several modules in one batch.
+
+        Args:
+            module_ids: Module IDs from create_module
+
+        Returns:
+            module_info() results in the same order as module_ids
+        """
+        return await self.call_many(
+            [("module_info", (module_id,)) for module_id in module_ids]
+        )
+
     async def module_options(self, module_id: str) -> str:
         """Get module options schema.
 
@@ -357,8 +878,10 @@ class MsfClient:
         Returns:
             Option value or None
         """
-        result = await self._call("module_get_option", module_id, key)
-        return result.get("value")
+        result = await self._call(
+            "module_get_option", module_id, key, result_type=_ValueResult
+        )
+        return result.value
 
     async def module_validate(self, module_id: str) -> bool:
         """Validate module configuration.
@@ -400,8 +923,14 @@ class MsfClient:
         Returns:
             Session ID if successful, None otherwise
         """
-        result = await self._call("module_exploit", module_id, payload, options)
-        return result.get("session_id")
+        result = await self._call(
+            "module_exploit",
+            module_id,
+            payload,
+            options,
+            result_type=_SessionIdResult,
+        )
+        return result.session_id
 
     async def module_run(
         self, module_id: str, options: dict[str, str] | None = None
@@ -493,8 +1022,10 @@ class MsfClient:
     # DataStore operations
     async def framework_get_option(self, key: str) -> str | None:
         """Get framework-level datastore option."""
-        result = await self._call("framework_get_option", key)
-        return result.get("value")
+        result = await self._call(
+            "framework_get_option", key, result_type=_ValueResult
+        )
+        return result.value
 
     async def framework_set_option(self, key: str, value: str) -> None:
         """Set framework-level datastore option."""
@@ -541,10 +1072,7 @@ class MsfClient:
             Generated payload bytes
         """
         result = await self._call("payload_generate", payload_name, options)
-        # Result is base64-encoded bytes
-        import base64
-
-        return base64.b64decode(result["payload"])
+        return result["payload"]
 
     async def payload_generate_encoded(
         self,
@@ -571,9 +1099,7 @@ class MsfClient:
             iterations,
             options,
         )
-        import base64
-
-        return base64.b64decode(result["payload"])
+        return result["payload"]
 
     async def payload_list_payloads(self) -> list[str]:
         """List all available payloads.
@@ -605,9 +1131,7 @@ class MsfClient:
         result = await self._call(
             "payload_generate_executable", payload_name, platform, arch, options
         )
-        import base64
-
-        return base64.b64decode(result["executable"])
+        return result["executable"]
 
     # DbManager operations
     async def db_hosts(self) -> list[str]:
@@ -616,8 +1140,8 @@ class MsfClient:
         Returns:
             List of host IP addresses
         """
-        result = await self._call("db_hosts")
-        return result["hosts"]
+        result = await self._call("db_hosts", result_type=_HostsResult)
+        return result.hosts
 
     async def db_services(self) -> list[str]:
         """Get all services from the database.
@@ -625,8 +1149,8 @@ class MsfClient:
         Returns:
             List of services
         """
-        result = await self._call("db_services")
-        return result["services"]
+        result = await self._call("db_services", result_type=_ServicesResult)
+        return result.services
 
     async def db_report_host(self, options: dict[str, str]) -> int:
         """Report a host to the database.
@@ -683,8 +1207,8 @@ class MsfClient:
         Returns:
             List of vulnerabilities
         """
-        result = await self._call("db_vulns")
-        return result["vulns"]
+        result = await self._call("db_vulns", result_type=_VulnsResult)
+        return result.vulns
 
     async def db_creds(self) -> list[str]:
         """Get all credentials from the database.
@@ -692,8 +1216,8 @@ class MsfClient:
         Returns:
             List of credentials
         """
-        result = await self._call("db_creds")
-        return result["creds"]
+        result = await self._call("db_creds", result_type=_CredsResult)
+        return result.creds
 
     async def db_loot(self) -> list[str]:
         """Get all loot from the database.
@@ -701,8 +1225,8 @@ class MsfClient:
         Returns:
             List of loot items
         """
-        result = await self._call("db_loot")
-        return result["loot"]
+        result = await self._call("db_loot", result_type=_LootResult)
+        return result.loot
 
     # JobManager operations
     async def job_list(self) -> list[str]:
@@ -711,8 +1235,8 @@ class MsfClient:
         Returns:
             List of job IDs
         """
-        result = await self._call("job_list")
-        return result["job_ids"]
+        result = await self._call("job_list", result_type=_JobIdsResult)
+        return result.job_ids
 
     async def job_get(self, job_id: str) -> str | None:
         """Get job information by ID.
@@ -745,8 +1269,8 @@ class MsfClient:
         Returns:
             List of loaded plugin names
         """
-        result = await self._call("plugins_list")
-        return result["plugins"]
+        result = await self._call("plugins_list", result_type=_PluginsResult)
+        return result.plugins
 
     async def plugins_load(
         self, path: str, options: dict[str, str] | None = None
@@ -851,6 +1375,24 @@ class MsfClient:
         result = await self._call("session_read", session_id, length)
         return result["data"]
 
+    async def session_read_bytes(
+        self, session_id: int, length: int | None = None
+    ) -> bytes:
+        """Read raw bytes from session.
+
+        Unlike session_read(), the data is sent back as MessagePack bin
+        and is never decoded as UTF-8, so binary output survives intact.
+
+        Args:
+            session_id: Session ID
+            length: Number of bytes to read (None = all available)
+
+        Returns:
+            Bytes read from session
+        """
+        result = await self._call("session_read_bytes", session_id, length)
+        return result["data"]
+
     async def session_write(self, session_id: int, data: str) -> int:
         """Write data to session.
 
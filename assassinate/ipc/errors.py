@@ -40,9 +40,15 @@ class SerializationError(IpcError):
 
 
 class DeserializationError(IpcError):
-    """Failed to deserialize message."""
+    """Failed to deserialize message.
 
-    pass
+    ``call_id`` is set when the envelope was decoded and only the result
+    of that call could not be.
+    """
+
+    def __init__(self, message: str, call_id: int | None = None):
+        self.call_id = call_id
+        super().__init__(message)
 
 
 class RemoteError(IpcError):
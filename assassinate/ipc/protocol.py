@@ -6,9 +6,11 @@ Also provides message serialization functions.
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping, Sequence
 from typing import Any, Protocol, runtime_checkable
 
-import msgpack
+import msgspec
 
 from assassinate.ipc.errors import DeserializationError, SerializationError
 
@@ -24,6 +26,7 @@ class ClientProtocol(Protocol):
     # Framework methods
     def framework_version(self) -> Any: ...
     def list_modules(self, module_type: str) -> Any: ...
+    def module_catalog_version(self) -> Any: ...
     def search(self, query: str) -> Any: ...
     def threads(self) -> Any: ...
 
@@ -63,6 +66,9 @@ class ClientProtocol(Protocol):
     def session_read(
         self, session_id: int, length: int | None = None
     ) -> Any: ...
+    def session_read_bytes(
+        self, session_id: int, length: int | None = None
+    ) -> Any: ...
     def session_write(self, session_id: int, data: str) -> Any: ...
     def session_execute(self, session_id: int, command: str) -> Any: ...
     def session_run_cmd(self, session_id: int, command: str) -> Any: ...
@@ -93,34 +99,115 @@ def is_async_client(client: ClientProtocol) -> bool:
     return isinstance(client, MsfClient)
 
 
-def serialize_call(call_id: int, method: str, args: list[Any]) -> bytes:
+# Messages go over the wire as positional arrays, matching the daemon's
+# Message struct field for field:
+# [call_id, [method, args] | nil, [result] | nil, [code, message] | nil]
+
+
+class _Request(msgspec.Struct, array_like=True):
+    method: str
+    args: Sequence[Any]
+
+
+class _Call(msgspec.Struct, array_like=True):
+    call_id: int
+    request: _Request
+    response: None = None
+    error: None = None
+
+
+class _Response(msgspec.Struct, array_like=True):
+    # Left undecoded until the result type for the call is known
+    result: msgspec.Raw
+
+
+class _Error(msgspec.Struct, array_like=True):
+    code: str
+    message: str
+
+
+class _ResponseMessage(msgspec.Struct, array_like=True):
+    call_id: int
+    request: None = None
+    response: _Response | None = None
+    error: _Error | None = None
+
+
+_encoder = msgspec.msgpack.Encoder()
+_response_decoder = msgspec.msgpack.Decoder(_ResponseMessage)
+_result_decoders: dict[Any, msgspec.msgpack.Decoder] = {
+    Any: msgspec.msgpack.Decoder()
+}
+
+
+def _result_decoder(result_type: Any) -> msgspec.msgpack.Decoder:
+    decoder = _result_decoders.get(result_type)
+    if decoder is None:
+        decoder = _result_decoders[result_type] = msgspec.msgpack.Decoder(
+            result_type
+        )
+    return decoder
+
+
+def serialize_call(call_id: int, method: str, args: Sequence[Any]) -> bytes:
     """Serialize a method call to bytes using MessagePack.
 
     Args:
         call_id: Unique call identifier
         method: Method name
-        args: Method arguments
+        args: Method arguments (list or tuple)
 
     Returns:
         Serialized message bytes
     """
     try:
-        message = {
-            "call_id": call_id,
-            "request": {"method": method, "args": args},
-        }
-        return msgpack.packb(message, use_bin_type=True)
-    except (TypeError, ValueError) as e:
+        return _encoder.encode(_Call(call_id, _Request(method, args)))
+    except (TypeError, ValueError, msgspec.MsgspecError) as e:
+        raise SerializationError(f"Failed to serialize call: {e}") from e
+
+
+def serialize_call_into(
+    buffer: bytearray,
+    call_id: int,
+    method: str,
+    args: Sequence[Any],
+    offset: int = 0,
+) -> None:
+    """Serialize a method call into an existing buffer.
+
+    Like serialize_call(), but reuses the caller's buffer instead of
+    allocating a new bytes object. Bytes before ``offset`` are left alone
+    and the buffer is truncated to the end of the message.
+
+    Args:
+        buffer: Buffer to write into
+        call_id: Unique call identifier
+        method: Method name
+        args: Method arguments (list or tuple)
+        offset: Position in the buffer to start writing at
+    """
+    try:
+        _encoder.encode_into(
+            _Call(call_id, _Request(method, args)), buffer, offset
+        )
+    except (TypeError, ValueError, msgspec.MsgspecError) as e:
         raise SerializationError(f"Failed to serialize call: {e}") from e
 
 
 def deserialize_response(
-    data: bytes,
+    data: bytes | memoryview,
+    result_types: Mapping[int, Any] | None = None,
 ) -> tuple[int, Any | None, dict[str, str] | None]:
     """Deserialize a response message using MessagePack.
 
+    The envelope is decoded straight into typed structs, so only the
+    result itself is materialized as Python containers. A result whose
+    call has an entry in ``result_types`` is decoded into that type
+    instead, which skips any fields the type does not declare.
+
     Args:
-        data: Serialized message bytes
+        data: Serialized message bytes, or a view of them
+        result_types: Result types to decode into, keyed by call ID
 
     Returns:
         Tuple of (call_id, result, error)
@@ -128,32 +215,39 @@ def deserialize_response(
         - If error: (call_id, None, {"code": str, "message": str})
     """
     try:
-        message = msgpack.unpackb(data, raw=False)
-        call_id = message["call_id"]
-
-        if "response" in message and message["response"] is not None:
-            response_data = message["response"]
-            # Response contains {"result": ...}
-            if isinstance(response_data, dict) and "result" in response_data:
-                return call_id, response_data["result"], None
-            # Fallback for backward compatibility
-            return call_id, response_data, None
-        elif "error" in message and message["error"] is not None:
-            error = message["error"]
-            return (
-                call_id,
-                None,
-                {"code": error["code"], "message": error["message"]},
-            )
-        else:
-            raise DeserializationError("Unknown message type")
-
-    except (
-        msgpack.exceptions.UnpackException,
-        KeyError,
-        ValueError,
-        TypeError,
-    ) as e:
+        message = _response_decoder.decode(data)
+    except msgspec.MsgspecError as e:
         raise DeserializationError(
             f"Failed to deserialize response: {e}"
         ) from e
+
+    if message.response is not None:
+        result_type = Any
+        if result_types:
+            result_type = result_types.get(message.call_id, Any)
+        try:
+            result = _result_decoder(result_type).decode(
+                message.response.result
+            )
+        except msgspec.MsgspecError as e:
+            call_id = message.call_id
+            # The traceback keeps this frame alive, and the raw result may
+            # still reference the caller's buffer
+            del message
+            raise DeserializationError(
+                f"Failed to deserialize result of call {call_id}: {e}",
+                call_id,
+            ) from e
+        return message.call_id, result, None
+    if message.error is not None:
+        # Codes come from a small fixed set, so share one string per code
+        # rather than keeping a fresh copy in every RemoteError
+        return (
+            message.call_id,
+            None,
+            {
+                "code": sys.intern(message.error.code),
+                "message": message.error.message,
+            },
+        )
+    raise DeserializationError("Unknown message type")
@@ -9,9 +9,22 @@ from __future__ import annotations
 import mmap
 import os
 import struct
+from collections.abc import Callable, Sequence
+from typing import TypeVar
 
 from assassinate.ipc.errors import BufferEmptyError, BufferFullError, IpcError
 
+T = TypeVar("T")
+
+# The cursors are the daemon's AtomicUsize values, so they use the native
+# format: CPython copies native integers with one memcpy, i.e. a single
+# 8-byte load or store, whereas "<Q" goes byte by byte and could tear
+# against a concurrent update from the other process.
+_U64 = struct.Struct("Q")
+_U32 = struct.Struct("<I")
+# write_pos and read_pos, each at the start of its own cache line
+_POSITIONS = struct.Struct("Q56xQ")
+
 
 class RingBuffer:
     """Lock-free SPSC ring buffer for IPC.
@@ -20,13 +33,22 @@ class RingBuffer:
     It must match the memory layout of the Rust RingBuffer exactly:
 
     Memory layout:
-        [write_pos: 8 bytes][read_pos: 8 bytes][padding: 48 bytes]
+        [write_pos: 8 bytes][padding: 56 bytes]
+        [read_pos: 8 bytes][padding: 56 bytes]
         [data: capacity bytes]
+
+    Each position sits on its own 64-byte cache line so the producer and
+    consumer do not invalidate each other's line on every update.
+
+    The capacity must be a power of two, so positions are mapped into the
+    data region with a bitmask instead of a modulo. Messages are packed back
+    to back as a byte stream: one that runs past the end of the data region
+    continues at its start.
     """
 
     WRITE_POS_OFFSET = 0
-    READ_POS_OFFSET = 8
-    DATA_OFFSET = 64
+    READ_POS_OFFSET = 64
+    DATA_OFFSET = 128
     HEADER_SIZE = 4  # u32 message length
 
     def __init__(self, name: str, capacity: int):
@@ -35,9 +57,18 @@ class RingBuffer:
         Args:
             name: Shared memory name (must start with /)
             capacity: Buffer capacity in bytes (must match Rust side)
+
+        Raises:
+            IpcError: If capacity is not a power of two
         """
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise IpcError(
+                f"Ring buffer capacity must be a power of 2, got {capacity}"
+            )
+
         self.name = name
         self.capacity = capacity
+        self._mask = capacity - 1
         self.total_size = self.DATA_OFFSET + capacity
 
         # Open shared memory
@@ -69,6 +100,7 @@ class RingBuffer:
                 mmap.PROT_READ | mmap.PROT_WRITE,
             )
             os.close(fd)
+            self._advise_hugepages()
         except IpcError:
             raise
         except (OSError, FileNotFoundError) as e:
@@ -77,46 +109,46 @@ class RingBuffer:
                 f"Make sure the assassinate_daemon is running."
             ) from e
 
-    def _read_atomic_u64(self, offset: int) -> int:
-        """Read a 64-bit atomic value with Acquire semantics.
-
-        Uses memory barriers to ensure proper visibility across
-        processes.
-        On x86-64, aligned 64-bit reads are atomic by hardware.
-        On other architectures, the memory barrier ensures visibility.
-        """
-        # Memory barrier before read (Acquire semantics)
-        # Ensures we see all writes that happened before this
-        # position was updated
-        self.mmap.seek(offset)
-        value = struct.unpack("<Q", self.mmap.read(8))[0]
-
-        # Compiler fence - prevent reordering by Python/OS
-        # On most systems, the seek/read operations already provide barriers,
-        # but we make it explicit for correctness
-        if hasattr(self.mmap, "madvise"):
-            # MADV_DONTNEED acts as a memory barrier on Linux
+    def _advise_hugepages(self) -> None:
+        """Ask the kernel to back the mapping with transparent huge pages.
+
+        Both processes sweep through the whole ring, so 2 MiB pages cut TLB
+        misses compared to 4 KiB ones. This is only a hint; whether tmpfs
+        honours it depends on the kernel's shmem_enabled setting.
+        """
+        advice = getattr(mmap, "MADV_HUGEPAGE", None)
+        if advice is None:
+            return
+        try:
+            self.mmap.madvise(advice)
+        except OSError:
             pass
 
-        return value
+    def _read_atomic_u64(self, offset: int) -> int:
+        """Read a 64-bit position with Acquire semantics.
 
-    def _write_atomic_u64(self, offset: int, value: int) -> None:
-        """Write a 64-bit atomic value with Release semantics.
+        Python cannot emit fences itself. This relies on x86-64, where an
+        aligned 8-byte load is atomic and is not reordered with the loads
+        that follow it, so data published before the position is visible.
+        """
+        return _U64.unpack_from(self.mmap, offset)[0]
 
-        Uses memory barriers to ensure data is visible before position update.
+    def _read_positions(self) -> tuple[int, int]:
+        """Read the write and read positions with a single unpack.
+
+        Returns:
+            Tuple of (write_pos, read_pos)
         """
-        # Write the value
-        self.mmap.seek(offset)
-        self.mmap.write(struct.pack("<Q", value))
+        return _POSITIONS.unpack_from(self.mmap, self.WRITE_POS_OFFSET)
+
+    def _write_atomic_u64(self, offset: int, value: int) -> None:
+        """Write a 64-bit position with Release semantics.
 
-        # Memory barrier after write (Release semantics)
-        # Ensures all previous writes are visible before this write completes
-        # On Linux with shared memory, we rely on the kernel's memory coherency.
-        # The mmap write operations provide sufficient ordering guarantees for
-        # our SPSC use case where the Rust side uses proper atomic operations.
-        # For truly portable atomics across all architectures, would need ctypes
-        # to call platform-specific atomic intrinsics, but that's overkill for
-        # the current x86-64 primary target.
+        As with reads, this relies on x86-64: an aligned 8-byte store is
+        atomic and stores are not reordered with earlier stores, so the
+        message data is visible before the new position.
+        """
+        _U64.pack_into(self.mmap, offset, value)
 
     def try_write(self, data: bytes) -> None:
         """Try to write a message to the ring buffer (non-blocking).
@@ -130,8 +162,7 @@ class RingBuffer:
         msg_size = self.HEADER_SIZE + len(data)
 
         # Check if we have space
-        write_pos = self._read_atomic_u64(self.WRITE_POS_OFFSET)
-        read_pos = self._read_atomic_u64(self.READ_POS_OFFSET)
+        write_pos, read_pos = self._read_positions()
 
         available = self.capacity - (write_pos - read_pos)
         if available < msg_size:
@@ -140,19 +171,95 @@ class RingBuffer:
                 f"available: {available})"
             )
 
-        # Write message length header (little-endian u32)
-        write_offset = (write_pos % self.capacity) + self.DATA_OFFSET
-        self.mmap.seek(write_offset)
-        self.mmap.write(struct.pack("<I", len(data)))
-
-        # Write message data
-        self.mmap.write(data)
+        write_offset = (write_pos & self._mask) + self.DATA_OFFSET
+        if write_offset + msg_size <= self.total_size:
+            # Write message length header (little-endian u32), then data
+            _U32.pack_into(self.mmap, write_offset, len(data))
+            start = write_offset + self.HEADER_SIZE
+            self.mmap[start : start + len(data)] = data
+        else:
+            self._write_wrapped(write_pos, _U32.pack(len(data)) + data)
 
         # Update write position
         self._write_atomic_u64(self.WRITE_POS_OFFSET, write_pos + msg_size)
 
+    def try_write_frame(self, frame: bytearray) -> None:
+        """Write a message whose length header space is already reserved.
+
+        The first HEADER_SIZE bytes of ``frame`` are overwritten with the
+        message length, then header and message go to shared memory in a
+        single copy.
+
+        Args:
+            frame: HEADER_SIZE placeholder bytes followed by the message
+
+        Raises:
+            BufferFullError: If buffer is full
+        """
+        msg_size = len(frame)
+
+        write_pos, read_pos = self._read_positions()
+
+        available = self.capacity - (write_pos - read_pos)
+        if available < msg_size:
+            raise BufferFullError(
+                f"Ring buffer full (capacity: {self.capacity}, "
+                f"available: {available})"
+            )
+
+        _U32.pack_into(frame, 0, msg_size - self.HEADER_SIZE)
+        self._write_wrapped(write_pos, frame)
+
+        self._write_atomic_u64(self.WRITE_POS_OFFSET, write_pos + msg_size)
+
+    def try_write_many(self, messages: Sequence[bytes]) -> None:
+        """Write several messages with one copy and one position update.
+
+        The messages are framed back to back exactly as repeated try_write()
+        calls would lay them out, but the reader only sees them once all of
+        them are in place.
+
+        Args:
+            messages: Message payloads to write, in order
+
+        Raises:
+            BufferFullError: If the buffer cannot hold all messages
+        """
+        self.try_write_frames(
+            b"".join(_U32.pack(len(data)) + data for data in messages)
+        )
+
+    def try_write_frames(self, frames: bytes | bytearray) -> None:
+        """Write messages that are already framed back to back.
+
+        Each message in ``frames`` must carry its own HEADER_SIZE length
+        header, as laid out by try_write_many(). The whole block is copied
+        in once and published with one position update.
+
+        Args:
+            frames: Length-prefixed messages, in order
+
+        Raises:
+            BufferFullError: If the buffer cannot hold all messages
+        """
+        write_pos, read_pos = self._read_positions()
+
+        available = self.capacity - (write_pos - read_pos)
+        if available < len(frames):
+            raise BufferFullError(
+                f"Ring buffer full (capacity: {self.capacity}, "
+                f"available: {available})"
+            )
+
+        self._write_wrapped(write_pos, frames)
+
+        self._write_atomic_u64(self.WRITE_POS_OFFSET, write_pos + len(frames))
+
     def try_read(self) -> bytes:
-        """Try to read a message from the ring buffer (non-blocking, zero-copy).
+        """Try to read a message from the ring buffer (non-blocking).
+
+        This copies the message out of shared memory. Use read_zero_copy()
+        to decode it in place instead.
 
         Returns:
             Message data (copied from shared memory)
@@ -160,20 +267,15 @@ class RingBuffer:
         Raises:
             BufferEmptyError: If buffer is empty
         """
-        write_pos = self._read_atomic_u64(self.WRITE_POS_OFFSET)
-        read_pos = self._read_atomic_u64(self.READ_POS_OFFSET)
+        write_pos, read_pos = self._read_positions()
 
         # Check if data is available
         if write_pos == read_pos:
             raise BufferEmptyError("Ring buffer empty")
 
-        # Read message length header
-        read_offset = (read_pos % self.capacity) + self.DATA_OFFSET
-        self.mmap.seek(read_offset)
-        msg_len = struct.unpack("<I", self.mmap.read(self.HEADER_SIZE))[0]
-
-        # Read message data
-        data = self.mmap.read(msg_len)
+        # Read message length header, then the message data
+        msg_len = self._read_length(read_pos)
+        data = self._read_wrapped(read_pos + self.HEADER_SIZE, msg_len)
 
         # Update read position
         self._write_atomic_u64(
@@ -182,10 +284,132 @@ class RingBuffer:
 
         return data
 
+    def try_read_many(self, max_messages: int | None = None) -> list[bytes]:
+        """Read every waiting message with one position update.
+
+        Only messages already published when the call starts are read, and
+        the writer sees the space come back once all of them are copied out.
+
+        Args:
+            max_messages: Maximum number of messages to read (default: all)
+
+        Returns:
+            Message data in order (empty if the buffer is empty)
+        """
+        write_pos, read_pos = self._read_positions()
+
+        messages: list[bytes] = []
+        pos = read_pos
+        while pos != write_pos and len(messages) != max_messages:
+            msg_len = self._read_length(pos)
+            pos += self.HEADER_SIZE
+            messages.append(self._read_wrapped(pos, msg_len))
+            pos += msg_len
+
+        if pos != read_pos:
+            self._write_atomic_u64(self.READ_POS_OFFSET, pos)
+        return messages
+
+    def read_zero_copy(self, callback: Callable[[memoryview], T]) -> T:
+        """Read a message in place and pass it to a callback (non-blocking).
+
+        The callback gets a memoryview straight into shared memory instead
+        of a copied bytes object. The view is released, and the slot handed
+        back to the writer, as soon as the callback returns, so the callback
+        must not keep references to it.
+
+        Args:
+            callback: Function that consumes the message view
+
+        Returns:
+            Whatever the callback returns
+
+        Raises:
+            BufferEmptyError: If buffer is empty
+        """
+        write_pos, read_pos = self._read_positions()
+
+        if write_pos == read_pos:
+            raise BufferEmptyError("Ring buffer empty")
+
+        msg_len = self._read_length(read_pos)
+        start = ((read_pos + self.HEADER_SIZE) & self._mask) + self.DATA_OFFSET
+
+        try:
+            if start + msg_len <= self.total_size:
+                with (
+                    memoryview(self.mmap) as region,
+                    region[start : start + msg_len] as view,
+                ):
+                    return callback(view)
+            # A message that wraps is not contiguous in shared memory, so
+            # the callback gets a copy instead
+            data = self._read_wrapped(read_pos + self.HEADER_SIZE, msg_len)
+            with memoryview(data) as view:
+                return callback(view)
+        finally:
+            # Consume the message even if the callback failed, so a bad
+            # message cannot wedge the reader
+            self._write_atomic_u64(
+                self.READ_POS_OFFSET, read_pos + self.HEADER_SIZE + msg_len
+            )
+
+    def _write_wrapped(self, pos: int, data: bytes | bytearray) -> None:
+        """Copy data into the data region at ring position ``pos``.
+
+        Bytes past the end of the region continue at its start, so this is
+        at most two slice assignments.
+
+        Args:
+            pos: Ring position to start writing at
+            data: Bytes to copy in (must fit in the free space)
+        """
+        offset = pos & self._mask
+        start = self.DATA_OFFSET + offset
+        first = self.capacity - offset
+        if len(data) <= first:
+            self.mmap[start : start + len(data)] = data
+            return
+        with memoryview(data) as view:
+            self.mmap[start : start + first] = view[:first]
+            end = self.DATA_OFFSET + len(data) - first
+            self.mmap[self.DATA_OFFSET : end] = view[first:]
+
+    def _read_wrapped(self, pos: int, size: int) -> bytes:
+        """Copy ``size`` bytes out of the data region at ring position ``pos``.
+
+        Args:
+            pos: Ring position to start reading at
+            size: Number of bytes to read
+
+        Returns:
+            The bytes, joined back together if they wrap
+        """
+        offset = pos & self._mask
+        start = self.DATA_OFFSET + offset
+        first = self.capacity - offset
+        if size <= first:
+            return self.mmap[start : start + size]
+        end = self.DATA_OFFSET + size - first
+        return (
+            self.mmap[start : start + first] + self.mmap[self.DATA_OFFSET : end]
+        )
+
+    def _read_length(self, pos: int) -> int:
+        """Read the message length header at ring position ``pos``."""
+        offset = pos & self._mask
+        if offset <= self.capacity - self.HEADER_SIZE:
+            return _U32.unpack_from(self.mmap, self.DATA_OFFSET + offset)[0]
+        return _U32.unpack(self._read_wrapped(pos, self.HEADER_SIZE))[0]
+
+    def is_empty(self) -> bool:
+        """Check whether there is no message waiting to be read."""
+        write_pos, read_pos = self._read_positions()
+        return write_pos == read_pos
+
     def utilization(self) -> float:
         """Get current buffer utilization (0.0 = empty, 1.0 = full)."""
-        write_pos = self._read_atomic_u64(self.WRITE_POS_OFFSET)
-        read_pos = self._read_atomic_u64(self.READ_POS_OFFSET)
+        write_pos, read_pos = self._read_positions()
         used = write_pos - read_pos
         return used / self.capacity
 
@@ -199,3 +423,53 @@ class RingBuffer:
 
     def __exit__(self, *args) -> None:
         self.close()
+
+
+class Doorbell:
+    """Consumer side of a ring buffer's wake-up FIFO.
+
+    The daemon creates a named FIFO next to the ring buffer and writes a
+    byte to it after each message, so the consumer can wait in the event
+    loop's selector instead of polling an empty ring.
+    """
+
+    def __init__(self, name: str):
+        """Open the doorbell FIFO for a ring buffer.
+
+        Args:
+            name: Ring buffer shared memory name
+
+        Raises:
+            FileNotFoundError: If the daemon did not create a doorbell
+        """
+        if name.startswith("/"):
+            self.path = f"/dev/shm{name}.notify"
+        else:
+            self.path = f"/dev/shm/{name}.notify"
+
+        # Non-blocking read-only open of a FIFO succeeds without a writer
+        self.fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+
+    def fileno(self) -> int:
+        """Return the descriptor to register with the event loop."""
+        return self.fd
+
+    def drain(self) -> bool:
+        """Consume all pending wake-ups.
+
+        Returns:
+            False if the daemon has closed its end of the FIFO, True otherwise
+        """
+        try:
+            while os.read(self.fd, 4096):
+                pass
+        except BlockingIOError:
+            return True
+        # Empty read without EAGAIN means end-of-file: no writer left
+        return False
+
+    def close(self) -> None:
+        """Close the doorbell descriptor."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
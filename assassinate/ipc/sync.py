@@ -6,12 +6,59 @@ running the event loop in a background thread.
 
 import asyncio
 import atexit
+import collections
+import concurrent.futures
+import functools
 import threading
+import weakref
+from collections.abc import Coroutine, Iterable, Sequence
 from typing import Any
 
 from assassinate.ipc.client import MsfClient
 
 
+class _Pending:
+    """Result slot for a coroutine submitted by a caller thread.
+
+    The caller waits on ``done``, a lock created already held and released
+    by the event loop once the outcome is stored. A bare lock is cheaper to
+    block on than a Future or Event, which both wait on a Condition.
+    """
+
+    __slots__ = ("done", "result", "exception")
+
+    def __init__(self) -> None:
+        self.done = threading.Lock()
+        self.done.acquire()
+        self.result: Any = None
+        self.exception: BaseException | None = None
+
+
+def _copy_result(pending: _Pending, task: asyncio.Future) -> None:
+    """Hand a finished task's outcome to the waiting caller."""
+    if task.cancelled():
+        pending.exception = concurrent.futures.CancelledError()
+    else:
+        pending.exception = task.exception()
+        if pending.exception is None:
+            pending.result = task.result()
+    pending.done.release()
+
+
+# Clients to clean up at interpreter exit. Held weakly, so a client that is
+# dropped without being connected does not live until exit.
+_live_clients: "weakref.WeakSet[SyncMsfClient]" = weakref.WeakSet()
+
+
+def _cleanup_live_clients() -> None:
+    """Clean up every client that is still alive at exit."""
+    for client in list(_live_clients):
+        client._cleanup()
+
+
+atexit.register(_cleanup_live_clients)
+
+
 class SyncMsfClient:
     """Thread-safe synchronous wrapper for MsfClient.
 
@@ -28,13 +75,18 @@ class SyncMsfClient:
     """
 
     def __init__(
-        self, shm_name: str | None = None, buffer_size: int | None = None
+        self,
+        shm_name: str | None = None,
+        buffer_size: int | None = None,
+        cpu_affinity: Iterable[int] | None = None,
     ):
         """Initialize sync client.
 
         Args:
             shm_name: Shared memory name (defaults to MsfClient.DEFAULT_SHM_NAME)
             buffer_size: Buffer size (defaults to MsfClient.DEFAULT_BUFFER_SIZE)
+            cpu_affinity: CPUs to pin the background event loop thread to
+                (see MsfClient)
         """
         self._loop: asyncio.AbstractEventLoop | None = None
         self._thread: threading.Thread | None = None
@@ -42,12 +94,20 @@ class SyncMsfClient:
         self._started = False
         self._lock = threading.Lock()
 
+        # Coroutines waiting to be started on the background loop
+        self._submissions: collections.deque[
+            tuple[Coroutine[Any, Any, Any], _Pending]
+        ] = collections.deque()
+        self._drain_scheduled = False
+        self._loop_thread_id: int | None = None
+
         # Store params for lazy initialization
         self._shm_name = shm_name or MsfClient.DEFAULT_SHM_NAME
         self._buffer_size = buffer_size or MsfClient.DEFAULT_BUFFER_SIZE
+        self._cpu_affinity = cpu_affinity
 
         # Register cleanup on exit
-        atexit.register(self._cleanup)
+        _live_clients.add(self)
 
     def _start_loop(self) -> None:
         """Start the background event loop thread."""
@@ -56,6 +116,12 @@ class SyncMsfClient:
                 return
 
             self._loop = asyncio.new_event_loop()
+            # Python 3.12+: start tasks eagerly, so a call whose reply is
+            # picked up on the fast path finishes inside the drain instead
+            # of waiting for another loop iteration
+            eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+            if eager_task_factory is not None:
+                self._loop.set_task_factory(eager_task_factory)
             self._thread = threading.Thread(
                 target=self._run_loop, daemon=True, name="AssassinateIPCThread"
             )
@@ -66,6 +132,7 @@ class SyncMsfClient:
         """Run the event loop in the background thread."""
         if self._loop is None:
             return
+        self._loop_thread_id = threading.get_ident()
         asyncio.set_event_loop(self._loop)
         self._loop.run_forever()
 
@@ -77,6 +144,10 @@ class SyncMsfClient:
 
         Returns:
             Result from the coroutine
+
+        Raises:
+            RuntimeError: If called from the background loop itself, where
+                waiting for the result would block the loop forever
         """
         if not self._started:
             self._start_loop()
@@ -84,9 +155,56 @@ class SyncMsfClient:
         if self._loop is None:
             raise RuntimeError("Event loop not initialized")
 
+        if self._loop_thread_id == threading.get_ident():
+            coro.close()
+            raise RuntimeError(
+                "SyncMsfClient called from its own event loop - "
+                "await the MsfClient coroutine instead"
+            )
+
         # Submit coroutine to background loop and wait for result
-        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
-        return future.result()
+        pending = _Pending()
+        self._submissions.append((coro, pending))
+        # Only wake the loop if no drain is pending yet; one wake-up then
+        # starts every call submitted from other threads in the meantime
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            try:
+                self._loop.call_soon_threadsafe(self._drain_submissions)
+            except Exception as e:
+                # The loop is closed, so no drain will run: fail everything
+                # queued behind the flag instead of leaving it to wait
+                self._drain_scheduled = False
+                self._fail_submissions(e)
+
+        pending.done.acquire()
+        if pending.exception is not None:
+            raise pending.exception
+        return pending.result
+
+    def _drain_submissions(self) -> None:
+        """Start all submitted coroutines (runs on the background loop)."""
+        # Clear the flag before draining: a submission that still sees it
+        # set was appended before this point and is picked up below
+        self._drain_scheduled = False
+        submissions = self._submissions
+        while submissions:
+            coro, pending = submissions.popleft()
+            task = asyncio.ensure_future(coro, loop=self._loop)
+            if task.done():
+                # Finished eagerly; no need to wait for the callback
+                _copy_result(pending, task)
+            else:
+                task.add_done_callback(functools.partial(_copy_result, pending))
+
+    def _fail_submissions(self, exc: BaseException) -> None:
+        """Fail all submitted coroutines without running them."""
+        submissions = self._submissions
+        while submissions:
+            coro, pending = submissions.popleft()
+            coro.close()
+            pending.exception = exc
+            pending.done.release()
 
     def connect(self) -> None:
         """Connect to the daemon synchronously."""
@@ -96,7 +214,9 @@ class SyncMsfClient:
         if self._async_client is None:
             # Create client in background thread
             async def _create_and_connect():
-                client = MsfClient(self._shm_name, self._buffer_size)
+                client = MsfClient(
+                    self._shm_name, self._buffer_size, self._cpu_affinity
+                )
                 await client.connect()
                 return client
 
@@ -137,6 +257,46 @@ class SyncMsfClient:
             raise RuntimeError("Not connected - call connect() first")
         return self._async_client
 
+    def call_many(
+        self, calls: Sequence[tuple[str, Sequence[Any]]], timeout: float = 5.0
+    ) -> list[Any]:
+        """Make several RPC calls in one batch."""
+        return self._run_coro(
+            self._ensure_connected().call_many(calls, timeout=timeout)
+        )
+
+    def batch(self, calls: Iterable[tuple[str, Sequence[Any]]]) -> list[Any]:
+        """Call several client methods with one hop to the event loop.
+
+        Unlike call_many(), which sends raw RPCs, this calls the named
+        MsfClient methods, so results are unpacked exactly as the matching
+        SyncMsfClient methods return them. All calls are in flight at once
+        and their requests are written to the ring buffer together.
+
+        Args:
+            calls: (method name, args) pairs, e.g.
+                ``[("session_info", (1,)), ("session_info", (2,))]``
+
+        Returns:
+            Results in the same order as calls
+
+        Raises:
+            AttributeError: If a name is not a public MsfClient method
+        """
+        client = self._ensure_connected()
+        bound = []
+        for name, args in calls:
+            if name.startswith("_"):
+                raise AttributeError(f"{name!r} is not a public method")
+            bound.append((getattr(client, name), args))
+
+        async def _run() -> list[Any]:
+            return list(
+                await asyncio.gather(*(method(*args) for method, args in bound))
+            )
+
+        return self._run_coro(_run())
+
     # Framework Core Methods
 
     def framework_version(self) -> dict[str, str]:
@@ -149,6 +309,10 @@ class SyncMsfClient:
             self._ensure_connected().list_modules(module_type)
         )
 
+    def module_catalog_version(self) -> int:
+        """Get module catalog version."""
+        return self._run_coro(self._ensure_connected().module_catalog_version())
+
     def search(self, query: str) -> list[str]:
         """Search for modules."""
         return self._run_coro(self._ensure_connected().search(query))
@@ -179,6 +343,14 @@ class SyncMsfClient:
         """Get module metadata."""
         return self._run_coro(self._ensure_connected().module_info(module_id))
 
+    def module_info_many(
+        self, module_ids: Sequence[str]
+    ) -> list[dict[str, Any]]:
+        """Get metadata for several modules in one batch."""
+        return self._run_coro(
+            self._ensure_connected().module_info_many(module_ids)
+        )
+
     def module_options(self, module_id: str) -> str:
         """Get module options schema."""
         return self._run_coro(
@@ -454,6 +626,14 @@ class SyncMsfClient:
             self._ensure_connected().session_read(session_id, length)
         )
 
+    def session_read_bytes(
+        self, session_id: int, length: int | None = None
+    ) -> bytes:
+        """Read raw bytes from session."""
+        return self._run_coro(
+            self._ensure_connected().session_read_bytes(session_id, length)
+        )
+
     def session_write(self, session_id: int, data: str) -> int:
         """Write to session."""
         return self._run_coro(
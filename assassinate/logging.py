@@ -17,10 +17,19 @@ current_call_id: ContextVar[int | None] = ContextVar(
     "current_call_id", default=None
 )
 
+# Structured format with context
+STRUCTURED_FORMAT = (
+    "%(asctime)s [%(levelname)8s] [%(call_id)s] %(name)s - %(message)s"
+)
+STRUCTURED_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
 
 class ContextFormatter(logging.Formatter):
     """Custom formatter that includes call context."""
 
+    # (second, datefmt, text) of the last timestamp formatted with a datefmt
+    _time_cache: tuple[int, str, str] | None = None
+
     def format(self, record: logging.LogRecord) -> str:
         # Add call_id to record if available
         call_id = current_call_id.get()
@@ -31,6 +40,54 @@ class ContextFormatter(logging.Formatter):
 
         return super().format(record)
 
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: str | None = None
+    ) -> str:
+        """Format the record time, reusing the text within one second.
+
+        strftime has one-second resolution, so every record logged in the
+        same second gets the same timestamp.
+        """
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        # Read and replace the cache as one tuple; handlers sharing this
+        # formatter do not share a lock
+        cache = self._time_cache
+        if cache is not None and cache[0] == second and cache[1] == datefmt:
+            return cache[2]
+        text = super().formatTime(record, datefmt)
+        self._time_cache = (second, datefmt, text)
+        return text
+
+
+class StructuredFormatter(ContextFormatter):
+    """ContextFormatter with the structured layout built into format().
+
+    Produces the same output as a ContextFormatter using STRUCTURED_FORMAT
+    and STRUCTURED_DATEFMT, but without interpreting a %-style format for
+    every record.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(STRUCTURED_FORMAT, datefmt=STRUCTURED_DATEFMT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        # Tracebacks and stack info are rare; leave them to the base class
+        if record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+
+        call_id = current_call_id.get()
+        context = "-" if call_id is None else call_id
+        record.call_id = context  # type: ignore
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        return (
+            f"{record.asctime} [{record.levelname:>8}] [{context}] "
+            f"{record.name} - {record.message}"
+        )
+
 
 def setup_logging(
     level: str = "INFO",
@@ -55,18 +112,12 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(log_level)
 
+    formatter: logging.Formatter
     if structured:
-        # Structured format with context
-        fmt = (
-            "%(asctime)s [%(levelname)8s] [%(call_id)s] %(name)s - %(message)s"
-        )
-        datefmt = "%Y-%m-%d %H:%M:%S"
+        formatter = StructuredFormatter()
     else:
         # Simple format
-        fmt = "%(levelname)s: %(message)s"
-        datefmt = None
-
-    formatter = ContextFormatter(fmt, datefmt=datefmt)
+        formatter = ContextFormatter("%(levelname)s: %(message)s")
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
 
@@ -97,30 +148,43 @@ class PerformanceLogger:
         self.logger = logger
         self.operation = operation
         self.context = context
-        self.start_time: float = 0
+        self.start_ns = 0
+        # Timings only show up in debug output, so with debug off the clock
+        # is never read and failures are logged without one
+        self.enabled = logger.isEnabledFor(logging.DEBUG)
+
+    def _details(self) -> str:
+        """Format the context as `` key=value`` pairs."""
+        return "".join(f" {k}={v}" for k, v in self.context.items())
+
+    def _elapsed_ms(self) -> float:
+        """Milliseconds since __enter__, at microsecond precision."""
+        # Integer nanoseconds until the end; the float is only for display
+        return (time.perf_counter_ns() - self.start_ns) // 1000 / 1000
 
     def __enter__(self) -> PerformanceLogger:
-        self.start_time = time.perf_counter()
-        if self.logger.isEnabledFor(logging.DEBUG):
-            ctx = " ".join(f"{k}={v}" for k, v in self.context.items())
-            self.logger.debug(f"{self.operation} started {ctx}".strip())
+        if self.enabled:
+            self.start_ns = time.perf_counter_ns()
+            self.logger.debug(f"{self.operation} started{self._details()}")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
-        elapsed = (time.perf_counter() - self.start_time) * 1000  # ms
+        if exc_type is None and not self.enabled:
+            return
 
+        details = self._details()
         if exc_type is not None:
             # Operation failed
-            ctx = " ".join(f"{k}={v}" for k, v in self.context.items())
+            timing = ""
+            if self.enabled:
+                timing = f" in {self._elapsed_ms():.2f}ms"
             self.logger.error(
-                f"{self.operation} failed in {elapsed:.2f}ms {ctx} "
-                f"error={exc_type.__name__}: {exc_val}".strip()
+                f"{self.operation} failed{timing}{details} "
+                f"error={exc_type.__name__}: {exc_val}"
             )
         else:
             # Operation succeeded
-            if self.logger.isEnabledFor(logging.DEBUG):
-                ctx = " ".join(f"{k}={v}" for k, v in self.context.items())
-                self.logger.debug(
-                    f"{self.operation} completed in {elapsed:.2f}ms "
-                    f"{ctx}".strip()
-                )
+            self.logger.debug(
+                f"{self.operation} completed in {self._elapsed_ms():.2f}ms"
+                f"{details}"
+            )
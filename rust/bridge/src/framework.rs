@@ -945,6 +945,37 @@ impl Session {
         }
     }
 
+    /// Read raw bytes from the session (raw version without PyO3)
+    ///
+    /// Unlike `read_raw`, the Ruby string is copied out byte-for-byte so
+    /// binary session output is not forced through UTF-8.
+    pub fn read_raw_bytes(&self, length: Option<usize>) -> Result<Vec<u8>> {
+        let ruby = crate::ruby_bridge::get_ruby()?;
+
+        let result = if let Some(len) = length {
+            let len_val = ruby
+                .eval::<Value>(&format!("{}", len))
+                .map_err(|e| AssassinateError::ConversionError(e.to_string()))?;
+            call_method(self.ruby_session, "read", &[len_val])?
+        } else {
+            call_method(self.ruby_session, "read", &[])?
+        };
+
+        if is_nil(result) {
+            return Ok(Vec::new());
+        }
+
+        let rstring: magnus::RString =
+            TryConvert::try_convert(result).map_err(|e: magnus::Error| {
+                AssassinateError::ConversionError(format!(
+                    "Failed to convert session data to RString: {}",
+                    e
+                ))
+            })?;
+        let bytes = unsafe { rstring.as_slice() }.to_vec();
+        Ok(bytes)
+    }
+
     /// Execute a command in the session (raw version without PyO3)
     pub fn execute_raw(&self, command: &str) -> Result<String> {
         let ruby = crate::ruby_bridge::get_ruby()?;
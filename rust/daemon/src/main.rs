@@ -1,9 +1,8 @@
 use anyhow::{Context, Result};
-use base64::{engine::general_purpose::STANDARD as BASE64, Engine as _};
 use bridge::{Framework, Module};
 use clap::Parser;
 use futures::stream::StreamExt;
-use ipc::{protocol, IpcError, RingBuffer, DEFAULT_BUFFER_SIZE, DEFAULT_SHM_NAME};
+use ipc::{protocol, Doorbell, IpcError, RingBuffer, DEFAULT_BUFFER_SIZE, DEFAULT_SHM_NAME};
 use parking_lot::Mutex;
 use signal_hook::consts::{SIGINT, SIGTERM};
 use signal_hook_tokio::Signals;
@@ -28,10 +27,12 @@ impl CleanupGuard {
     fn cleanup(&self) {
         let request_shm_path = format!("/dev/shm/{}_req", self.shm_name);
         let response_shm_path = format!("/dev/shm/{}_resp", self.shm_name);
+        let response_doorbell_path = Doorbell::path_for(&format!("{}_resp", self.shm_name));
 
-        // Try to remove both, don't care if they fail
+        // Try to remove all of them, don't care if they fail
         let _ = std::fs::remove_file(&request_shm_path);
         let _ = std::fs::remove_file(&response_shm_path);
+        let _ = std::fs::remove_file(&response_doorbell_path);
     }
 }
 
@@ -68,12 +69,23 @@ struct Daemon {
     framework: Framework,
     request_buffer: RingBuffer,  // Python writes, Daemon reads
     response_buffer: RingBuffer, // Daemon writes, Python reads
+    response_doorbell: Doorbell, // Rung after each response is written
     shutdown: Arc<AtomicBool>,
     request_count: AtomicU64,
     error_count: AtomicU64,
     // Module instance storage
     modules: Arc<Mutex<HashMap<String, Module>>>,
     next_module_id: AtomicU64,
+    // Bumped whenever the module catalog may have changed (plugin load/unload)
+    catalog_version: AtomicU64,
+}
+
+/// Result of a dispatched call, before serialization
+enum Reply {
+    /// Regular JSON-shaped result
+    Json(serde_json::Value),
+    /// Raw bytes sent back as `{key: <bin>}`
+    Binary(&'static str, Vec<u8>),
 }
 
 /// Helper function to parse options from JSON Value to HashMap
@@ -91,17 +103,20 @@ impl Daemon {
         framework: Framework,
         request_buffer: RingBuffer,
         response_buffer: RingBuffer,
+        response_doorbell: Doorbell,
         shutdown: Arc<AtomicBool>,
     ) -> Self {
         Self {
             framework,
             request_buffer,
             response_buffer,
+            response_doorbell,
             shutdown,
             request_count: AtomicU64::new(0),
             error_count: AtomicU64::new(0),
             modules: Arc::new(Mutex::new(HashMap::new())),
             next_module_id: AtomicU64::new(1),
+            catalog_version: AtomicU64::new(0),
         }
     }
 
@@ -123,7 +138,7 @@ impl Daemon {
                     backoff_micros = MIN_BACKOFF_MICROS;
                     self.request_count.fetch_add(1, Ordering::Relaxed);
 
-                    match self.process_request(data).await {
+                    match self.process_request(&data).await {
                         Ok(()) => {}
                         Err(e) => {
                             self.error_count.fetch_add(1, Ordering::Relaxed);
@@ -177,8 +192,12 @@ impl Daemon {
 
         // Dispatch and measure
         let dispatch_start = Instant::now();
-        let response = match self.dispatch_call(&method, args).await {
-            Ok(result) => {
+        let dispatched = match self.dispatch_binary_call(&method, &args) {
+            Some(result) => result.map(|(key, data)| Reply::Binary(key, data)),
+            None => self.dispatch_call(&method, args).await.map(Reply::Json),
+        };
+        let response = match dispatched {
+            Ok(reply) => {
                 let dispatch_time = dispatch_start.elapsed();
                 debug!(
                     call_id = call_id,
@@ -186,7 +205,12 @@ impl Daemon {
                     dispatch_ms = dispatch_time.as_millis(),
                     "RPC call succeeded"
                 );
-                protocol::serialize_response(call_id, result)?
+                match reply {
+                    Reply::Json(result) => protocol::serialize_response(call_id, result)?,
+                    Reply::Binary(key, data) => {
+                        protocol::serialize_binary_response(call_id, key, &data)?
+                    }
+                }
             }
             Err(e) => {
                 let dispatch_time = dispatch_start.elapsed();
@@ -208,6 +232,7 @@ impl Daemon {
         self.response_buffer
             .try_write(&response)
             .context("Failed to write response to ring buffer")?;
+        self.response_doorbell.ring();
 
         let total_time = start.elapsed();
         debug!(
@@ -221,6 +246,92 @@ impl Daemon {
         Ok(())
     }
 
+    /// Dispatch methods whose result is raw bytes
+    ///
+    /// Returns `None` for methods handled by `dispatch_call`. Results are
+    /// `(key, bytes)` pairs sent back as a MessagePack `bin` field so binary
+    /// data never has to round-trip through a UTF-8 string.
+    fn dispatch_binary_call(
+        &self,
+        method: &str,
+        args: &[serde_json::Value],
+    ) -> Option<Result<(&'static str, Vec<u8>)>> {
+        match method {
+            "payload_generate" => Some(self.payload_generate(args)),
+            "payload_generate_encoded" => Some(self.payload_generate_encoded(args)),
+            "payload_generate_executable" => Some(self.payload_generate_executable(args)),
+            "session_read_bytes" => Some(self.session_read_bytes(args)),
+            _ => None,
+        }
+    }
+
+    fn payload_generate(&self, args: &[serde_json::Value]) -> Result<(&'static str, Vec<u8>)> {
+        let payload_name = args
+            .get(0)
+            .and_then(|v| v.as_str())
+            .context("Missing payload_name")?;
+        let options = parse_options(args.get(1));
+
+        let pg = bridge::PayloadGenerator::new(&self.framework)?;
+        Ok(("payload", pg.generate(payload_name, options)?))
+    }
+
+    fn payload_generate_encoded(
+        &self,
+        args: &[serde_json::Value],
+    ) -> Result<(&'static str, Vec<u8>)> {
+        let payload_name = args
+            .get(0)
+            .and_then(|v| v.as_str())
+            .context("Missing payload_name")?;
+        let encoder = args.get(1).and_then(|v| v.as_str());
+        let iterations = args.get(2).and_then(|v| v.as_i64()).map(|i| i as i32);
+        let options = parse_options(args.get(3));
+
+        let pg = bridge::PayloadGenerator::new(&self.framework)?;
+        let payload_bytes = pg.generate_encoded(payload_name, encoder, iterations, options)?;
+        Ok(("payload", payload_bytes))
+    }
+
+    fn payload_generate_executable(
+        &self,
+        args: &[serde_json::Value],
+    ) -> Result<(&'static str, Vec<u8>)> {
+        let payload_name = args
+            .get(0)
+            .and_then(|v| v.as_str())
+            .context("Missing payload_name")?;
+        let platform = args
+            .get(1)
+            .and_then(|v| v.as_str())
+            .context("Missing platform")?;
+        let arch = args
+            .get(2)
+            .and_then(|v| v.as_str())
+            .context("Missing arch")?;
+        let options = parse_options(args.get(3));
+
+        let pg = bridge::PayloadGenerator::new(&self.framework)?;
+        let exe_bytes = pg.generate_executable(payload_name, platform, arch, options)?;
+        Ok(("executable", exe_bytes))
+    }
+
+    fn session_read_bytes(&self, args: &[serde_json::Value]) -> Result<(&'static str, Vec<u8>)> {
+        let session_id = args
+            .get(0)
+            .and_then(|v| v.as_i64())
+            .context("Missing session_id")?;
+        let length = args.get(1).and_then(|v| v.as_u64()).map(|v| v as usize);
+
+        let sessions = self.framework.sessions()?;
+        if let Some(sess_val) = sessions.get_raw(session_id)? {
+            let session = bridge::Session::from_raw(sess_val, session_id);
+            Ok(("data", session.read_raw_bytes(length)?))
+        } else {
+            anyhow::bail!("Session not found")
+        }
+    }
+
     /// Dispatch method call to MSF framework
     async fn dispatch_call(
         &self,
@@ -252,6 +363,11 @@ impl Daemon {
             }
 
             // === Module Search and Discovery ===
+            "module_catalog_version" => {
+                let version = self.catalog_version.load(Ordering::Acquire);
+                Ok(serde_json::json!({ "version": version }))
+            }
+
             "search" => {
                 let query = _args
                     .get(0)
@@ -589,65 +705,12 @@ impl Daemon {
             }
 
             // === PayloadGenerator Operations ===
-            "payload_generate" => {
-                let payload_name = _args
-                    .get(0)
-                    .and_then(|v| v.as_str())
-                    .context("Missing payload_name")?;
-                let options = parse_options(_args.get(1));
-
-                let pg = bridge::PayloadGenerator::new(&self.framework)?;
-                let payload_bytes = pg.generate(payload_name, options)?;
-                let payload_b64 = BASE64.encode(&payload_bytes);
-
-                Ok(serde_json::json!({ "payload": payload_b64 }))
-            }
-
-            "payload_generate_encoded" => {
-                let payload_name = _args
-                    .get(0)
-                    .and_then(|v| v.as_str())
-                    .context("Missing payload_name")?;
-                let encoder = _args.get(1).and_then(|v| v.as_str());
-                let iterations = _args.get(2).and_then(|v| v.as_i64()).map(|i| i as i32);
-                let options = parse_options(_args.get(3));
-
-                let pg = bridge::PayloadGenerator::new(&self.framework)?;
-                let payload_bytes =
-                    pg.generate_encoded(payload_name, encoder, iterations, options)?;
-                let payload_b64 = BASE64.encode(&payload_bytes);
-
-                Ok(serde_json::json!({ "payload": payload_b64 }))
-            }
-
             "payload_list_payloads" => {
                 let pg = bridge::PayloadGenerator::new(&self.framework)?;
                 let payloads = pg.list_payloads()?;
                 Ok(serde_json::json!({ "payloads": payloads }))
             }
 
-            "payload_generate_executable" => {
-                let payload_name = _args
-                    .get(0)
-                    .and_then(|v| v.as_str())
-                    .context("Missing payload_name")?;
-                let platform = _args
-                    .get(1)
-                    .and_then(|v| v.as_str())
-                    .context("Missing platform")?;
-                let arch = _args
-                    .get(2)
-                    .and_then(|v| v.as_str())
-                    .context("Missing arch")?;
-                let options = parse_options(_args.get(3));
-
-                let pg = bridge::PayloadGenerator::new(&self.framework)?;
-                let exe_bytes = pg.generate_executable(payload_name, platform, arch, options)?;
-                let exe_b64 = BASE64.encode(&exe_bytes);
-
-                Ok(serde_json::json!({ "executable": exe_b64 }))
-            }
-
             // === Database Manager Operations ===
             "db_hosts" => {
                 let db = self.framework.db()?;
@@ -746,6 +809,7 @@ impl Daemon {
 
                 let plugins = self.framework.plugins()?;
                 let plugin_name = plugins.load_raw(path, options)?;
+                self.catalog_version.fetch_add(1, Ordering::Release);
                 Ok(serde_json::json!({ "plugin_name": plugin_name }))
             }
 
@@ -756,6 +820,7 @@ impl Daemon {
                     .context("Missing plugin_name")?;
                 let plugins = self.framework.plugins()?;
                 let success = plugins.unload_raw(plugin_name)?;
+                self.catalog_version.fetch_add(1, Ordering::Release);
                 Ok(serde_json::json!({ "success": success }))
             }
 
@@ -1165,6 +1230,8 @@ async fn main() -> Result<()> {
         .context("Failed to create request ring buffer")?;
     let response_buffer = RingBuffer::create(&response_buffer_name, args.buffer_size)
         .context("Failed to create response ring buffer")?;
+    let response_doorbell =
+        Doorbell::create(&response_buffer_name).context("Failed to create response doorbell")?;
     info!("Ring buffers created successfully");
 
     // Setup signal handling
@@ -1178,7 +1245,13 @@ async fn main() -> Result<()> {
     });
 
     // Create and run daemon
-    let daemon = Daemon::new(framework, request_buffer, response_buffer, shutdown);
+    let daemon = Daemon::new(
+        framework,
+        request_buffer,
+        response_buffer,
+        response_doorbell,
+        shutdown,
+    );
     let result = daemon.run().await;
 
     // Cleanup
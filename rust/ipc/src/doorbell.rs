@@ -0,0 +1,90 @@
+/// Wake-up notification for ring buffer consumers
+///
+/// A named FIFO that sits next to a ring buffer's shared memory file. The
+/// producer writes one byte after enqueueing a message, so the consumer can
+/// block in its event loop (epoll) instead of polling an empty ring.
+///
+/// An eventfd would need its descriptor passed over a Unix socket; a FIFO can
+/// be opened by name from Python the same way the ring buffer is.
+use crate::error::{IpcError, Result};
+use std::ffi::CString;
+use std::os::unix::io::RawFd;
+
+pub struct Doorbell {
+    path: String,
+    fd: RawFd,
+}
+
+impl Doorbell {
+    /// Filesystem path of the doorbell FIFO for a ring buffer name
+    pub fn path_for(name: &str) -> String {
+        if name.starts_with('/') {
+            format!("/dev/shm{}.notify", name)
+        } else {
+            format!("/dev/shm/{}.notify", name)
+        }
+    }
+
+    /// Create the doorbell FIFO for a ring buffer (producer side)
+    ///
+    /// The FIFO is opened read-write and non-blocking: opening never waits
+    /// for a reader, and ringing never blocks or raises SIGPIPE when no
+    /// consumer is attached.
+    pub fn create(name: &str) -> Result<Self> {
+        let path = Self::path_for(name);
+        let c_path = CString::new(path.clone())
+            .map_err(|e| IpcError::SharedMemory(format!("Invalid doorbell path: {}", e)))?;
+
+        // Replace any FIFO left behind by a previous daemon
+        let _ = std::fs::remove_file(&path);
+        if unsafe { libc::mkfifo(c_path.as_ptr(), 0o600) } != 0 {
+            return Err(IpcError::Io(std::io::Error::last_os_error()));
+        }
+
+        let fd = unsafe { libc::open(c_path.as_ptr(), libc::O_RDWR | libc::O_NONBLOCK) };
+        if fd < 0 {
+            return Err(IpcError::Io(std::io::Error::last_os_error()));
+        }
+
+        Ok(Self { path, fd })
+    }
+
+    /// Wake the consumer
+    ///
+    /// A full pipe (EAGAIN) is ignored: the consumer already has pending
+    /// wake-ups and drains the whole ring on each one.
+    #[inline]
+    pub fn ring(&self) {
+        let byte = 1u8;
+        unsafe {
+            libc::write(self.fd, &byte as *const u8 as *const libc::c_void, 1);
+        }
+    }
+}
+
+impl Drop for Doorbell {
+    fn drop(&mut self) {
+        unsafe {
+            libc::close(self.fd);
+        }
+        let _ = std::fs::remove_file(&self.path);
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_path_for() {
+        assert_eq!(Doorbell::path_for("/ipc_resp"), "/dev/shm/ipc_resp.notify");
+        assert_eq!(Doorbell::path_for("ipc_resp"), "/dev/shm/ipc_resp.notify");
+    }
+
+    #[test]
+    fn test_create_and_ring() {
+        let doorbell = Doorbell::create("/test_doorbell").unwrap();
+        doorbell.ring();
+        assert!(std::path::Path::new(&Doorbell::path_for("/test_doorbell")).exists());
+    }
+}
@@ -31,6 +31,7 @@
 //! let response_bytes = rb.try_read().unwrap();
 //! ```
 
+pub mod doorbell;
 pub mod error;
 pub mod ring_buffer;
 pub mod shm;
@@ -43,6 +44,7 @@ pub mod msf_capnp {
 pub mod protocol;
 
 // Re-export main types
+pub use doorbell::Doorbell;
 pub use error::{IpcError, Result};
 pub use ring_buffer::RingBuffer;
 pub use shm::SharedMemory;
@@ -93,7 +95,7 @@ impl IpcClient {
     /// Try to read a response (non-blocking)
     pub fn try_recv(&self) -> Result<Vec<u8>> {
         let data = self.ring_buffer.try_read()?;
-        Ok(data.to_vec())
+        Ok(data.into_owned())
     }
 
     /// Get buffer utilization
@@ -2,8 +2,14 @@
 ///
 /// Using MessagePack for high-performance binary serialization.
 /// ~5-10x faster than JSON with smaller message sizes.
+///
+/// Messages are encoded as positional arrays rather than maps, so field
+/// names never go over the wire:
+/// `[call_id, [method, args] | nil, [result] | nil, [code, message] | nil]`.
+/// The Python client's msgspec structs are declared `array_like` to match.
 use crate::error::{IpcError, Result};
 use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
 
 #[derive(Serialize, Deserialize, Debug)]
 struct Request {
@@ -42,7 +48,7 @@ pub fn serialize_call(call_id: u64, method: &str, args: Vec<serde_json::Value>)
         error: None,
     };
 
-    rmp_serde::to_vec_named(&message).map_err(|e| IpcError::Serialization(e.to_string()))
+    rmp_serde::to_vec(&message).map_err(|e| IpcError::Serialization(e.to_string()))
 }
 
 /// Deserialize an MSF call from bytes
@@ -68,7 +74,7 @@ pub fn serialize_response(call_id: u64, result: serde_json::Value) -> Result<Vec
         error: None,
     };
 
-    rmp_serde::to_vec_named(&message).map_err(|e| IpcError::Serialization(e.to_string()))
+    rmp_serde::to_vec(&message).map_err(|e| IpcError::Serialization(e.to_string()))
 }
 
 /// Serialize an error
@@ -83,8 +89,47 @@ pub fn serialize_error(call_id: u64, code: &str, message: &str) -> Result<Vec<u8
         }),
     };
 
-    // Use to_vec_named to produce a map with string keys (consistent with serialize_response)
-    rmp_serde::to_vec_named(&msg).map_err(|e| IpcError::Serialization(e.to_string()))
+    rmp_serde::to_vec(&msg).map_err(|e| IpcError::Serialization(e.to_string()))
+}
+
+/// Byte slice that serializes as MessagePack `bin` instead of an array
+struct Bin<'a>(&'a [u8]);
+
+impl Serialize for Bin<'_> {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> std::result::Result<S::Ok, S::Error> {
+        serializer.serialize_bytes(self.0)
+    }
+}
+
+#[derive(Serialize)]
+struct BinaryResponse<'a> {
+    result: HashMap<&'a str, Bin<'a>>,
+}
+
+#[derive(Serialize)]
+struct BinaryMessage<'a> {
+    call_id: u64,
+    request: Option<Request>,
+    response: Option<BinaryResponse<'a>>,
+    error: Option<Error>,
+}
+
+/// Serialize a response whose result is `{key: <bin>}`
+///
+/// `serde_json::Value` has no binary type, so byte payloads would otherwise
+/// have to be transcoded to a string. This writes them as a MessagePack
+/// `bin` field, which the Python side receives as `bytes`.
+pub fn serialize_binary_response(call_id: u64, key: &str, data: &[u8]) -> Result<Vec<u8>> {
+    let message = BinaryMessage {
+        call_id,
+        request: None,
+        response: Some(BinaryResponse {
+            result: HashMap::from([(key, Bin(data))]),
+        }),
+        error: None,
+    };
+
+    rmp_serde::to_vec(&message).map_err(|e| IpcError::Serialization(e.to_string()))
 }
 
 #[cfg(test)]
@@ -104,4 +149,24 @@ mod tests {
         assert_eq!(parsed_method, method);
         assert_eq!(parsed_args, args);
     }
+
+    #[test]
+    fn test_messages_are_positional_arrays() {
+        let bytes = serialize_response(9, serde_json::json!("ok")).unwrap();
+        // fixarray(4): call_id, nil request, [result], nil error
+        assert_eq!(bytes, [0x94, 9, 0xc0, 0x91, 0xa2, b'o', b'k', 0xc0]);
+
+        let bytes = serialize_error(9, "E", "m").unwrap();
+        assert_eq!(bytes, [0x94, 9, 0xc0, 0xc0, 0x92, 0xa1, b'E', 0xa1, b'm']);
+    }
+
+    #[test]
+    fn test_serialize_binary_response_uses_bin() {
+        let data = [0u8, 0xff, 0x80];
+        let bytes = serialize_binary_response(7, "data", &data).unwrap();
+
+        // bin8 marker followed by the length and the raw payload
+        let needle = [0xc4, 3, 0x00, 0xff, 0x80];
+        assert!(bytes.windows(needle.len()).any(|w| w == needle));
+    }
 }
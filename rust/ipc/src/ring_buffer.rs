@@ -4,20 +4,29 @@
 /// Target: <100ns overhead per operation.
 use crate::error::{IpcError, Result};
 use crate::shm::SharedMemory;
+use std::borrow::Cow;
 use std::sync::atomic::{AtomicUsize, Ordering};
 use std::sync::Arc;
 
 /// Message header in ring buffer
-/// Layout: [length: u32][data: [u8; length]]
+/// Layout: [length: u32 little-endian][data: [u8; length]]
+///
+/// Messages are packed back to back as a byte stream, so a message (or its
+/// header) that reaches the end of the data region continues at its start.
 const HEADER_SIZE: usize = 4;
 
 /// Lock-free ring buffer for IPC
 ///
 /// Memory layout:
-/// [write_pos: 8 bytes][read_pos: 8 bytes][padding: 48 bytes][data: capacity bytes]
+/// [write_pos: 8 bytes][padding: 56 bytes][read_pos: 8 bytes][padding: 56 bytes]
+/// [data: capacity bytes]
+///
+/// Each position gets its own 64-byte cache line, so the producer bumping
+/// write_pos does not invalidate the line the consumer updates read_pos in
+/// (false sharing), and neither shares a line with the start of the data.
 ///
-/// The 48-byte padding ensures write_pos and read_pos are on separate cache lines (64 bytes)
-/// to prevent false sharing and maximize performance.
+/// The capacity is always a power of two: positions only ever grow, and both
+/// sides map them into the data region with `pos & (capacity - 1)`.
 pub struct RingBuffer {
     shm: Arc<SharedMemory>,
     capacity: usize,
@@ -29,14 +38,14 @@ pub struct RingBuffer {
 impl RingBuffer {
     /// Offset for atomic counters in shared memory
     const WRITE_POS_OFFSET: usize = 0;
-    const READ_POS_OFFSET: usize = 8;
-    const DATA_OFFSET: usize = 64; // Start after cache line to avoid false sharing
+    const READ_POS_OFFSET: usize = 64;
+    const DATA_OFFSET: usize = 128;
 
     /// Create a new ring buffer in shared memory
     ///
     /// # Arguments
     /// * `name` - Shared memory name
-    /// * `capacity` - Buffer capacity in bytes (should be power of 2 for optimal performance)
+    /// * `capacity` - Buffer capacity in bytes (must be a power of 2)
     pub fn create(name: &str, capacity: usize) -> Result<Self> {
         // Ensure capacity is power of 2
         if !capacity.is_power_of_two() {
@@ -69,6 +78,12 @@ impl RingBuffer {
 
     /// Open an existing ring buffer
     pub fn open(name: &str, capacity: usize) -> Result<Self> {
+        if !capacity.is_power_of_two() {
+            return Err(IpcError::SharedMemory(
+                "Ring buffer capacity must be power of 2".to_string(),
+            ));
+        }
+
         let total_size = Self::DATA_OFFSET + capacity;
         let shm = Arc::new(SharedMemory::open(name, total_size)?);
 
@@ -102,18 +117,10 @@ impl RingBuffer {
             return Err(IpcError::RingBufferFull(self.capacity));
         }
 
-        // Write message length header (ensure 4-byte alignment)
-        let write_offset = (write_pos_val % self.capacity) + self.data_offset;
-        let header_ptr = unsafe { self.shm.as_ptr().add(write_offset) };
-        unsafe {
-            // Use unaligned write to avoid alignment issues
-            std::ptr::write_unaligned(header_ptr as *mut u32, data.len() as u32);
-        }
-
-        // Write message data
-        let data_ptr = unsafe { self.shm.as_ptr().add(write_offset + HEADER_SIZE) };
+        // Write message length header, then the message data
         unsafe {
-            std::ptr::copy_nonoverlapping(data.as_ptr(), data_ptr, data.len());
+            self.write_wrapped(write_pos_val, &(data.len() as u32).to_le_bytes());
+            self.write_wrapped(write_pos_val + HEADER_SIZE, data);
         }
 
         // Update write position with Release ordering to ensure visibility
@@ -126,12 +133,13 @@ impl RingBuffer {
 
     /// Try to read a message from the ring buffer (non-blocking, zero-copy)
     ///
-    /// Returns a slice pointing directly into shared memory.
-    /// The slice is valid until the next read operation.
+    /// Returns a slice pointing directly into shared memory, valid until the
+    /// next read operation. A message that wraps past the end of the data
+    /// region is copied out instead.
     ///
     /// # Performance
     /// Target: <100ns (just atomic load + pointer arithmetic)
-    pub fn try_read(&self) -> Result<&[u8]> {
+    pub fn try_read(&self) -> Result<Cow<'_, [u8]>> {
         let write_pos_val = unsafe { (*self.write_pos).load(Ordering::Acquire) };
         let read_pos_val = unsafe { (*self.read_pos).load(Ordering::Acquire) };
 
@@ -140,21 +148,58 @@ impl RingBuffer {
             return Err(IpcError::RingBufferEmpty);
         }
 
-        // Read message length header (use unaligned read)
-        let read_offset = (read_pos_val % self.capacity) + self.data_offset;
-        let header_ptr = unsafe { self.shm.as_ptr().add(read_offset) };
-        let msg_len = unsafe { std::ptr::read_unaligned(header_ptr as *const u32) } as usize;
-
-        // Return zero-copy slice into shared memory
-        let data_ptr = unsafe { self.shm.as_ptr().add(read_offset + HEADER_SIZE) };
-        let slice = unsafe { std::slice::from_raw_parts(data_ptr, msg_len) };
+        // Read message length header
+        let mut header = [0u8; HEADER_SIZE];
+        unsafe { self.read_wrapped(read_pos_val, &mut header) };
+        let msg_len = u32::from_le_bytes(header) as usize;
+
+        // Zero-copy slice into shared memory, unless the message wraps
+        let data_pos = read_pos_val + HEADER_SIZE;
+        let offset = data_pos & (self.capacity - 1);
+        let data = if offset + msg_len <= self.capacity {
+            let data_ptr = unsafe { self.shm.as_ptr().add(self.data_offset + offset) };
+            Cow::Borrowed(unsafe { std::slice::from_raw_parts(data_ptr, msg_len) })
+        } else {
+            let mut buf = vec![0u8; msg_len];
+            unsafe { self.read_wrapped(data_pos, &mut buf) };
+            Cow::Owned(buf)
+        };
 
         // Update read position
         unsafe {
             (*self.read_pos).store(read_pos_val + HEADER_SIZE + msg_len, Ordering::Release);
         }
 
-        Ok(slice)
+        Ok(data)
+    }
+
+    /// Copy `src` into the data region at ring position `pos`
+    ///
+    /// Bytes past the end of the region continue at its start, so this is
+    /// at most two contiguous copies.
+    ///
+    /// # Safety
+    /// `src` must fit in the free space starting at `pos`.
+    #[inline]
+    unsafe fn write_wrapped(&self, pos: usize, src: &[u8]) {
+        let offset = pos & (self.capacity - 1);
+        let first = src.len().min(self.capacity - offset);
+        let base = self.shm.as_ptr().add(self.data_offset);
+        std::ptr::copy_nonoverlapping(src.as_ptr(), base.add(offset), first);
+        std::ptr::copy_nonoverlapping(src.as_ptr().add(first), base, src.len() - first);
+    }
+
+    /// Copy `dst.len()` bytes out of the data region at ring position `pos`
+    ///
+    /// # Safety
+    /// The bytes starting at `pos` must have been published by the writer.
+    #[inline]
+    unsafe fn read_wrapped(&self, pos: usize, dst: &mut [u8]) {
+        let offset = pos & (self.capacity - 1);
+        let first = dst.len().min(self.capacity - offset);
+        let base = self.shm.as_ptr().add(self.data_offset);
+        std::ptr::copy_nonoverlapping(base.add(offset), dst.as_mut_ptr(), first);
+        std::ptr::copy_nonoverlapping(base, dst.as_mut_ptr().add(first), dst.len() - first);
     }
 
     /// Get current buffer utilization (0.0 = empty, 1.0 = full)
@@ -187,7 +232,7 @@ mod tests {
         rb.try_write(msg).unwrap();
 
         let read_msg = rb.try_read().unwrap();
-        assert_eq!(read_msg, msg);
+        assert_eq!(&*read_msg, msg);
     }
 
     #[test]
@@ -202,7 +247,7 @@ mod tests {
         for i in 0..10 {
             let msg = rb.try_read().unwrap();
             let expected = format!("message {}", i);
-            assert_eq!(msg, expected.as_bytes());
+            assert_eq!(&*msg, expected.as_bytes());
         }
     }
 
@@ -214,4 +259,17 @@ mod tests {
         let result = rb.try_write(&large_msg);
         assert!(matches!(result, Err(IpcError::RingBufferFull(_))));
     }
+
+    #[test]
+    fn test_wrap_around() {
+        let rb = RingBuffer::create("test_ring4", 64).unwrap();
+
+        // 4 + 26 bytes twice leaves 4 bytes before the end of the region,
+        // so the third message's header fits and its data wraps
+        for round in 0..4u8 {
+            let msg = vec![round; 26];
+            rb.try_write(&msg).unwrap();
+            assert_eq!(&*rb.try_read().unwrap(), &msg[..]);
+        }
+    }
 }
@@ -0,0 +1,394 @@
+"""Unit tests for MsfClient request/response routing.
+
+These tests stand up the two shared-memory ring buffers in /dev/shm and
+answer requests from an in-process fake daemon, so no Rust build or MSF
+install is needed.
+"""
+
+import asyncio
+import os
+import uuid
+
+import msgspec
+import pytest
+
+from assassinate.ipc import MsfClient
+from assassinate.ipc.client import CPU_AFFINITY_ENV
+from assassinate.ipc.errors import (
+    BufferFullError,
+    ConnectionError,
+    DeserializationError,
+    RemoteError,
+    SerializationError,
+    TimeoutError,
+)
+from assassinate.ipc.shm import RingBuffer
+
+BUFFER_SIZE = 64 * 1024
+
+
+@pytest.fixture
+def shm_name():
+    """Create empty request/response ring buffers for one test."""
+    name = f"/assassinate_test_{uuid.uuid4().hex}"
+    paths = [f"/dev/shm{name}_req", f"/dev/shm{name}_resp"]
+    for path in paths:
+        with open(path, "wb") as f:
+            f.truncate(RingBuffer.DATA_OFFSET + BUFFER_SIZE)
+    yield name
+    for path in paths:
+        os.unlink(path)
+    doorbell = f"/dev/shm{name}_resp.notify"
+    if os.path.exists(doorbell):
+        os.unlink(doorbell)
+
+
+async def fake_daemon(shm_name, handler, doorbell=False):
+    """Serve requests with ``handler(method, args)`` until cancelled.
+
+    With ``doorbell`` set the response doorbell FIFO must already exist and
+    is rung after every response, like the real daemon does.
+    """
+    requests = RingBuffer(f"{shm_name}_req", BUFFER_SIZE)
+    responses = RingBuffer(f"{shm_name}_resp", BUFFER_SIZE)
+    bell = None
+    if doorbell:
+        bell = os.open(
+            f"/dev/shm{shm_name}_resp.notify", os.O_RDWR | os.O_NONBLOCK
+        )
+    try:
+        while True:
+            try:
+                message = msgspec.msgpack.decode(requests.try_read())
+            except Exception:
+                await asyncio.sleep(0)
+                continue
+            call_id, (method, args), _, _ = message
+            try:
+                reply = [call_id, None, [handler(method, args)], None]
+            except Exception as e:
+                reply = [call_id, None, None, ["CallFailed", str(e)]]
+            responses.try_write(msgspec.msgpack.encode(reply))
+            if bell is not None:
+                os.write(bell, b"\x01")
+    finally:
+        requests.close()
+        responses.close()
+        if bell is not None:
+            os.close(bell)
+
+
+@pytest.mark.unit
+class TestResponseRouting:
+    """Tests for routing daemon responses back to callers."""
+
+    async def test_concurrent_calls_get_their_own_results(self, shm_name):
+        """Test that concurrent calls each receive their own response."""
+        daemon = asyncio.create_task(
+            fake_daemon(shm_name, lambda method, args: {"echo": args[0]})
+        )
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        try:
+            results = await asyncio.gather(
+                *(client._call("echo", i) for i in range(20))
+            )
+            assert [r["echo"] for r in results] == list(range(20))
+        finally:
+            await client.disconnect()
+            daemon.cancel()
+
+    async def test_remote_error_is_raised(self, shm_name):
+        """Test that daemon errors surface as RemoteError."""
+
+        def handler(method, args):
+            raise ValueError("boom")
+
+        daemon = asyncio.create_task(fake_daemon(shm_name, handler))
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        try:
+            with pytest.raises(RemoteError, match="boom"):
+                await client._call("anything")
+        finally:
+            await client.disconnect()
+            daemon.cancel()
+
+    async def test_typed_result(self, shm_name):
+        """Test that result_type decodes the result into that type."""
+
+        class Echo(msgspec.Struct):
+            echo: int
+
+        daemon = asyncio.create_task(
+            fake_daemon(shm_name, lambda method, args: {"echo": args[0]})
+        )
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        try:
+            assert await client._call("echo", 3, result_type=Echo) == Echo(3)
+            with pytest.raises(DeserializationError):
+                await client._call("echo", "x", result_type=Echo, timeout=1.0)
+            assert not client._result_types
+        finally:
+            await client.disconnect()
+            daemon.cancel()
+
+    async def test_unanswered_call_times_out(self, shm_name):
+        """Test that a call with no response raises TimeoutError."""
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        try:
+            with pytest.raises(TimeoutError, match="never_answered"):
+                await client._call("never_answered", timeout=0.05)
+            assert not client._pending_calls
+        finally:
+            await client.disconnect()
+
+    async def test_concurrent_requests_flush_together(self, shm_name):
+        """Test that requests queued behind an in-flight call are batched."""
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        requests = RingBuffer(f"{shm_name}_req", BUFFER_SIZE)
+        try:
+            first = asyncio.create_task(client._call("first"))
+            await asyncio.sleep(0.01)
+            rest = [
+                asyncio.create_task(client._call("queued", i)) for i in range(3)
+            ]
+            await asyncio.sleep(0.01)
+
+            methods = []
+            while not requests.is_empty():
+                message = msgspec.msgpack.decode(requests.try_read())
+                methods.append(message[1][0])
+            assert methods == ["first", "queued", "queued", "queued"]
+            assert not client._queued_calls
+        finally:
+            requests.close()
+            await client.disconnect()
+        for task in [first, *rest]:
+            with pytest.raises(ConnectionError):
+                await task
+
+    async def test_unserializable_call_fails_alone(self, shm_name):
+        """Test that a queued call that cannot be encoded fails by itself."""
+        daemon = asyncio.create_task(
+            fake_daemon(shm_name, lambda method, args: {"echo": args[0]})
+        )
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        try:
+            # The first call is in flight, so the rest are queued together
+            results = await asyncio.gather(
+                client._call("echo", 0, timeout=1.0),
+                client._call("echo", 1, timeout=1.0),
+                client._call("echo", object(), timeout=1.0),
+                client._call("echo", 3, timeout=1.0),
+                return_exceptions=True,
+            )
+            assert isinstance(results.pop(2), SerializationError)
+            assert [r["echo"] for r in results] == [0, 1, 3]
+            assert not client._queued_frames
+        finally:
+            await client.disconnect()
+            daemon.cancel()
+
+    async def test_failed_flush_fails_queued_calls(self, shm_name):
+        """Test that queued calls fail if their flush does not fit."""
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        try:
+            big = "x" * (BUFFER_SIZE // 2)
+            first = asyncio.create_task(client._call("first", big))
+            await asyncio.sleep(0.01)
+            results = await asyncio.gather(
+                client._call("second", big),
+                client._call("third", big),
+                return_exceptions=True,
+            )
+            assert all(isinstance(r, BufferFullError) for r in results)
+        finally:
+            await client.disconnect()
+        with pytest.raises(ConnectionError):
+            await first
+
+    async def test_disconnect_fails_pending_calls(self, shm_name):
+        """Test that calls still waiting on disconnect are failed."""
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+
+        # No daemon is running, so this call never gets a response
+        call = asyncio.create_task(client._call("never_answered"))
+        await asyncio.sleep(0.01)
+        await client.disconnect()
+
+        with pytest.raises(ConnectionError):
+            await call
+
+
+@pytest.mark.unit
+class TestFastPath:
+    """Tests for picking up a reply in _call without the reader."""
+
+    async def test_reply_already_in_buffer(self, shm_name):
+        """Test that a reply ready right after the request is returned."""
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        responses = RingBuffer(f"{shm_name}_resp", BUFFER_SIZE)
+        try:
+            # Call IDs start at 1; no daemon runs, so only the fast path
+            # can see this reply before the call times out
+            responses.try_write(
+                msgspec.msgpack.encode([1, None, ["fast"], None])
+            )
+            assert await client._call("anything", timeout=0.05) == "fast"
+            assert not client._pending_calls
+        finally:
+            responses.close()
+            await client.disconnect()
+
+    async def test_error_reply_raises(self, shm_name):
+        """Test that an error reply on the fast path raises RemoteError."""
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        responses = RingBuffer(f"{shm_name}_resp", BUFFER_SIZE)
+        try:
+            responses.try_write(
+                msgspec.msgpack.encode([1, None, None, ["CallFailed", "boom"]])
+            )
+            with pytest.raises(RemoteError, match="boom"):
+                await client._call("anything", timeout=0.05)
+        finally:
+            responses.close()
+            await client.disconnect()
+
+
+@pytest.mark.unit
+class TestCallMany:
+    """Tests for batching calls with call_many."""
+
+    async def test_results_in_call_order(self, shm_name):
+        """Test that batched results come back in call order."""
+        daemon = asyncio.create_task(
+            fake_daemon(shm_name, lambda method, args: [method, *args])
+        )
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        try:
+            results = await client.call_many(
+                [("first", ()), ("second", (1, 2)), ("third", ["x"])]
+            )
+            assert results == [["first"], ["second", 1, 2], ["third", "x"]]
+            assert not client._pending_calls
+        finally:
+            await client.disconnect()
+            daemon.cancel()
+
+    async def test_remote_error_fails_batch(self, shm_name):
+        """Test that one failing call raises RemoteError for the batch."""
+
+        def handler(method, args):
+            if method == "bad":
+                raise ValueError("boom")
+            return method
+
+        daemon = asyncio.create_task(fake_daemon(shm_name, handler))
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        try:
+            with pytest.raises(RemoteError, match="boom"):
+                await client.call_many([("good", ()), ("bad", ())])
+            assert not client._pending_calls
+        finally:
+            await client.disconnect()
+            daemon.cancel()
+
+    async def test_module_info_many(self, shm_name):
+        """Test that module_info_many batches one module_info per ID."""
+        daemon = asyncio.create_task(
+            fake_daemon(shm_name, lambda method, args: {method: args[0]})
+        )
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        try:
+            assert await client.module_info_many(["1", "2"]) == [
+                {"module_info": "1"},
+                {"module_info": "2"},
+            ]
+        finally:
+            await client.disconnect()
+            daemon.cancel()
+
+    async def test_unanswered_batch_times_out(self, shm_name):
+        """Test that a batch with missing responses raises TimeoutError."""
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        try:
+            with pytest.raises(TimeoutError, match="Batch of 2"):
+                await client.call_many([("a", ()), ("b", ())], timeout=0.05)
+            assert not client._pending_calls
+        finally:
+            await client.disconnect()
+
+
+@pytest.mark.unit
+class TestResponseDoorbell:
+    """Tests for waking the response reader through the doorbell FIFO."""
+
+    async def test_calls_complete_with_doorbell(self, shm_name):
+        """Test that responses are delivered when the daemon rings."""
+        os.mkfifo(f"/dev/shm{shm_name}_resp.notify")
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        daemon = asyncio.create_task(
+            fake_daemon(shm_name, lambda method, args: {"echo": args[0]}, True)
+        )
+        try:
+            assert client._doorbell is not None
+            for i in range(5):
+                result = await client._call("echo", i, timeout=1.0)
+                assert result["echo"] == i
+                # Let the reader go back to waiting on the doorbell
+                await asyncio.sleep(0.01)
+        finally:
+            await client.disconnect()
+            daemon.cancel()
+
+    async def test_falls_back_to_polling_without_doorbell(self, shm_name):
+        """Test that a missing doorbell leaves the client polling."""
+        client = MsfClient(shm_name, BUFFER_SIZE)
+        await client.connect()
+        try:
+            assert client._doorbell is None
+        finally:
+            await client.disconnect()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(
+    not hasattr(os, "sched_setaffinity"), reason="needs sched_setaffinity"
+)
+class TestCpuAffinity:
+    """Tests for pinning the event loop thread on connect."""
+
+    async def test_connect_pins_thread(self, shm_name):
+        """Test that connect() pins the calling thread to the given CPUs."""
+        original = os.sched_getaffinity(0)
+        cpu = min(original)
+        client = MsfClient(shm_name, BUFFER_SIZE, cpu_affinity=[cpu])
+        try:
+            await client.connect()
+            assert os.sched_getaffinity(0) == {cpu}
+        finally:
+            await client.disconnect()
+            os.sched_setaffinity(0, original)
+
+    def test_affinity_from_environment(self, monkeypatch):
+        """Test that ASSASSINATE_IPC_CPU sets the default CPUs."""
+        monkeypatch.setenv(CPU_AFFINITY_ENV, "2,3")
+        assert MsfClient().cpu_affinity == {2, 3}
+        assert MsfClient(cpu_affinity=[1]).cpu_affinity == {1}
+
+        monkeypatch.setenv(CPU_AFFINITY_ENV, "not-a-cpu")
+        assert MsfClient().cpu_affinity is None
@@ -0,0 +1,97 @@
+"""Unit tests for the logging formatters."""
+
+import logging
+import sys
+
+import pytest
+
+from assassinate.logging import (
+    STRUCTURED_DATEFMT,
+    STRUCTURED_FORMAT,
+    ContextFormatter,
+    PerformanceLogger,
+    StructuredFormatter,
+    current_call_id,
+)
+
+
+def make_record(exc_info=None):
+    """Build a record like the IPC client's debug logging produces."""
+    return logging.LogRecord(
+        "assassinate.ipc.client",
+        logging.DEBUG,
+        __file__,
+        1,
+        "Calling %s (call_id=%d)",
+        ("framework_version", 7),
+        exc_info,
+    )
+
+
+@pytest.mark.unit
+class TestStructuredFormatter:
+    """Tests for StructuredFormatter."""
+
+    @pytest.mark.parametrize("call_id", [None, 7])
+    def test_matches_generic_formatter(self, call_id):
+        """Test that output matches the %-style structured format."""
+        generic = ContextFormatter(STRUCTURED_FORMAT, STRUCTURED_DATEFMT)
+        token = current_call_id.set(call_id)
+        try:
+            assert StructuredFormatter().format(
+                make_record()
+            ) == generic.format(make_record())
+        finally:
+            current_call_id.reset(token)
+
+    def test_traceback_is_appended(self):
+        """Test that records with exception info keep their traceback."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+
+        text = StructuredFormatter().format(make_record(exc_info))
+        assert "Calling framework_version (call_id=7)" in text
+        assert text.endswith("ValueError: boom")
+
+    def test_timestamp_reused_within_second(self):
+        """Test that records in the same second share the timestamp."""
+        formatter = StructuredFormatter()
+        first, second = make_record(), make_record()
+        second.created = int(first.created) + 0.999
+        first.created = int(first.created)
+
+        assert formatter.formatTime(second, STRUCTURED_DATEFMT) is (
+            formatter.formatTime(first, STRUCTURED_DATEFMT)
+        )
+
+
+@pytest.mark.unit
+class TestPerformanceLogger:
+    """Tests for PerformanceLogger."""
+
+    def test_debug_logs_timing(self, caplog):
+        """Test that start and completion are logged with debug on."""
+        logger = logging.getLogger("assassinate.test_perf")
+        with caplog.at_level(logging.DEBUG, logger=logger.name):
+            with PerformanceLogger(logger, "op", call_id=1):
+                pass
+        assert [r.getMessage() for r in caplog.records][0] == (
+            "op started call_id=1"
+        )
+        assert "op completed in" in caplog.records[1].getMessage()
+
+    def test_quiet_without_debug(self, caplog):
+        """Test that success is silent and failure untimed without debug."""
+        logger = logging.getLogger("assassinate.test_perf")
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            with PerformanceLogger(logger, "op") as tracker:
+                pass
+            assert tracker.start_ns == 0
+            with pytest.raises(ValueError):
+                with PerformanceLogger(logger, "op"):
+                    raise ValueError("boom")
+        assert [r.getMessage() for r in caplog.records] == [
+            "op failed error=ValueError: boom"
+        ]
@@ -0,0 +1,91 @@
+"""Unit tests for MessagePack message serialization."""
+
+import msgspec
+import pytest
+
+from assassinate.ipc.errors import DeserializationError
+from assassinate.ipc.protocol import (
+    deserialize_response,
+    serialize_call,
+    serialize_call_into,
+)
+
+
+@pytest.mark.unit
+class TestSerializeCall:
+    """Tests for serialize_call."""
+
+    @pytest.mark.parametrize(
+        "call_id,method,args",
+        [
+            (1, "framework_version", ()),
+            (2**40, "search", ("type:exploit",)),
+            (7, "module_set_option", ["0", "RHOSTS", None, {"a": "b"}]),
+        ],
+    )
+    def test_matches_packed_array(self, call_id, method, args):
+        """Test that output is the daemon's positional message array."""
+        expected = msgspec.msgpack.encode(
+            [call_id, [method, list(args)], None, None]
+        )
+        assert serialize_call(call_id, method, args) == expected
+
+    def test_into_keeps_prefix(self):
+        """Test that serialize_call_into writes after the given offset."""
+        buffer = bytearray(b"HDR!" + b"stale" * 10)
+        serialize_call_into(buffer, 5, "threads", (), offset=4)
+
+        assert buffer[:4] == b"HDR!"
+        assert bytes(buffer[4:]) == serialize_call(5, "threads", ())
+
+
+@pytest.mark.unit
+class TestDeserializeResponse:
+    """Tests for deserialize_response."""
+
+    def test_result(self):
+        """Test decoding a successful response."""
+        data = msgspec.msgpack.encode(
+            [3, None, [{"payload": b"\x00\xff"}], None]
+        )
+        assert deserialize_response(data) == (3, {"payload": b"\x00\xff"}, None)
+
+    def test_error(self):
+        """Test decoding an error response."""
+        data = msgspec.msgpack.encode([4, None, None, ["CallFailed", "boom"]])
+        assert deserialize_response(data) == (
+            4,
+            None,
+            {"code": "CallFailed", "message": "boom"},
+        )
+        # Error codes are interned, so repeated errors share one string
+        first = deserialize_response(data)[2]["code"]
+        assert deserialize_response(data)[2]["code"] is first
+
+    def test_typed_result(self):
+        """Test decoding a result into the type registered for its call."""
+
+        class Modules(msgspec.Struct):
+            modules: list[str] = []
+
+        data = msgspec.msgpack.encode(
+            [5, None, [{"modules": ["a"], "extra": [1, 2]}], None]
+        )
+        call_id, result, error = deserialize_response(data, {5: Modules})
+        assert (call_id, result, error) == (5, Modules(["a"]), None)
+        # Calls without a registered type still decode to plain containers
+        assert deserialize_response(data, {6: Modules})[1] == {
+            "modules": ["a"],
+            "extra": [1, 2],
+        }
+
+    def test_typed_result_mismatch(self):
+        """Test that a result not matching its type names the call."""
+
+        class Version(msgspec.Struct):
+            version: int
+
+        data = msgspec.msgpack.encode([8, None, [{"version": "x"}], None])
+        with pytest.raises(DeserializationError) as excinfo:
+            deserialize_response(data, {8: Version})
+        assert excinfo.value.call_id == 8
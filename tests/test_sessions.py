@@ -7,6 +7,8 @@ the scope of unit testing.
 
 import pytest
 
+from assassinate.bridge.sessions import Session
+
 
 @pytest.mark.integration
 class TestSessionList:
@@ -115,6 +117,11 @@ class TestSessionInteraction:
         with pytest.raises(Exception):  # Will raise RemoteError
             await client.session_read(99999)
 
+    async def test_read_bytes_fails_on_nonexistent(self, client):
+        """Test that read_bytes raises error for nonexistent session."""
+        with pytest.raises(Exception):  # Will raise RemoteError
+            await client.session_read_bytes(99999)
+
     async def test_write_fails_on_nonexistent(self, client):
         """Test that write raises error for nonexistent session."""
         with pytest.raises(Exception):  # Will raise RemoteError
@@ -131,6 +138,48 @@ class TestSessionInteraction:
             await client.session_run_cmd(99999, "sysinfo")
 
 
+class RecordingClient:
+    """Stands in for an async client, recording session calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def session_write(self, session_id, data):
+        self.calls.append(("session_write", session_id, data))
+        return len(data)
+
+    async def session_read(self, session_id, length):
+        self.calls.append(("session_read", session_id, length))
+        return "out"
+
+    async def session_read_bytes(self, session_id, length):
+        self.calls.append(("session_read_bytes", session_id, length))
+        return b"\x00\xff"
+
+
+@pytest.mark.unit
+class TestSessionWrapper:
+    """Tests for the bridge Session read/write wrappers."""
+
+    def test_write(self):
+        """Test that write() forwards to session_write."""
+        client = RecordingClient()
+        assert Session(3, client).write("id\n") == 3
+        assert client.calls == [("session_write", 3, "id\n")]
+
+    def test_read(self):
+        """Test that read() forwards to session_read and returns text."""
+        client = RecordingClient()
+        assert Session(3, client).read(16) == "out"
+        assert client.calls == [("session_read", 3, 16)]
+
+    def test_read_bytes(self):
+        """Test that read_bytes() returns the raw bytes."""
+        client = RecordingClient()
+        assert Session(3, client).read_bytes() == b"\x00\xff"
+        assert client.calls == [("session_read_bytes", 3, None)]
+
+
 @pytest.mark.integration
 class TestSessionWorkflow:
     """Tests for complete session workflows."""
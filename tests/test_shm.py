@@ -0,0 +1,161 @@
+"""Unit tests for the Python side of the shared-memory ring buffer."""
+
+import os
+import uuid
+
+import pytest
+
+from assassinate.ipc.errors import BufferEmptyError, BufferFullError, IpcError
+from assassinate.ipc.shm import RingBuffer
+
+CAPACITY = 4096
+
+
+@pytest.fixture
+def ring():
+    """Create an empty ring buffer backed by a /dev/shm file."""
+    name = f"/assassinate_test_{uuid.uuid4().hex}"
+    path = f"/dev/shm{name}"
+    with open(path, "wb") as f:
+        f.truncate(RingBuffer.DATA_OFFSET + CAPACITY)
+    rb = RingBuffer(name, CAPACITY)
+    yield rb
+    rb.close()
+    os.unlink(path)
+
+
+@pytest.mark.unit
+class TestReadZeroCopy:
+    """Tests for RingBuffer.read_zero_copy."""
+
+    def test_callback_sees_message(self, ring):
+        """Test that the callback receives the written message."""
+        ring.try_write(b"first")
+        ring.try_write(b"second")
+
+        assert ring.read_zero_copy(bytes) == b"first"
+        assert ring.read_zero_copy(bytes) == b"second"
+        assert ring.is_empty()
+
+    def test_empty_raises(self, ring):
+        """Test that reading an empty buffer raises BufferEmptyError."""
+        with pytest.raises(BufferEmptyError):
+            ring.read_zero_copy(bytes)
+
+    def test_message_consumed_when_callback_fails(self, ring):
+        """Test that a failing callback does not wedge the reader."""
+        ring.try_write(b"bad")
+        ring.try_write(b"good")
+
+        def fail(view):
+            raise ValueError("cannot decode")
+
+        with pytest.raises(ValueError):
+            ring.read_zero_copy(fail)
+        assert ring.try_read() == b"good"
+
+
+@pytest.mark.unit
+class TestWriteFrame:
+    """Tests for RingBuffer.try_write_frame."""
+
+    def test_frame_reads_back_without_header(self, ring):
+        """Test that the reserved header is filled with the length."""
+        ring.try_write_frame(bytearray(b"\0\0\0\0payload"))
+
+        assert ring.try_read() == b"payload"
+
+
+@pytest.mark.unit
+class TestWriteMany:
+    """Tests for RingBuffer.try_write_many."""
+
+    def test_messages_read_back_individually(self, ring):
+        """Test that batched messages are framed like single writes."""
+        ring.try_write_many([b"one", b"", b"three"])
+
+        assert ring.try_read() == b"one"
+        assert ring.try_read() == b""
+        assert ring.try_read() == b"three"
+        assert ring.is_empty()
+
+    def test_full_buffer_writes_nothing(self, ring):
+        """Test that a batch that does not fit is rejected as a whole."""
+        with pytest.raises(BufferFullError):
+            ring.try_write_many([b"x" * 2000, b"y" * 2000, b"z" * 100])
+        assert ring.is_empty()
+
+    def test_read_many(self, ring):
+        """Test that try_read_many drains messages in order."""
+        ring.try_write_many([b"a", b"bb", b"ccc"])
+
+        assert ring.try_read_many(2) == [b"a", b"bb"]
+        assert ring.try_read_many() == [b"ccc"]
+        assert ring.try_read_many() == []
+        assert ring.is_empty()
+
+    def test_preframed_messages_read_back(self, ring):
+        """Test that try_write_frames writes length-prefixed messages."""
+        ring.try_write_frames(bytearray(b"\2\0\0\0hi\0\0\0\0\3\0\0\0bye"))
+
+        assert ring.try_read() == b"hi"
+        assert ring.try_read() == b""
+        assert ring.try_read() == b"bye"
+        assert ring.is_empty()
+
+
+@pytest.mark.unit
+class TestPositions:
+    """Tests for reading the ring buffer cursors."""
+
+    def test_positions_track_writes_and_reads(self, ring):
+        """Test that one positions read sees both cursors move."""
+        assert ring._read_positions() == (0, 0)
+        ring.try_write(b"abc")
+        assert ring._read_positions() == (ring.HEADER_SIZE + 3, 0)
+        ring.try_read()
+        assert ring._read_positions() == (ring.HEADER_SIZE + 3,) * 2
+
+
+@pytest.mark.unit
+class TestCapacity:
+    """Tests for validating the ring buffer capacity."""
+
+    def test_non_power_of_two_rejected(self):
+        """Test that a capacity the bitmask cannot index is refused."""
+        with pytest.raises(IpcError, match="power of 2"):
+            RingBuffer("/assassinate_test_unused", 3000)
+
+
+@pytest.mark.unit
+class TestWrapAround:
+    """Tests for messages that run past the end of the data region."""
+
+    def _advance_to(self, ring, pos):
+        """Write and consume one filler message ending at ``pos``."""
+        ring.try_write(b"\0" * (pos - ring.HEADER_SIZE))
+        ring.try_read()
+
+    @pytest.mark.parametrize("pos", [CAPACITY - 2, CAPACITY - 10])
+    def test_try_read(self, ring, pos):
+        """Test that a split header or payload reads back intact."""
+        self._advance_to(ring, pos)
+        message = bytes(range(64))
+        ring.try_write(message)
+        assert ring.try_read() == message
+        assert ring.is_empty()
+
+    @pytest.mark.parametrize("pos", [CAPACITY - 2, CAPACITY - 10])
+    def test_read_zero_copy(self, ring, pos):
+        """Test that the callback sees a wrapped message intact."""
+        self._advance_to(ring, pos)
+        message = bytes(range(64))
+        ring.try_write(message)
+        assert ring.read_zero_copy(bytes) == message
+
+    def test_frames(self, ring):
+        """Test that a block of frames can straddle the end."""
+        self._advance_to(ring, CAPACITY - 6)
+        ring.try_write_many([b"first", b"second"])
+        assert ring.try_read() == b"first"
+        assert ring.try_read() == b"second"
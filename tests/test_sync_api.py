@@ -4,8 +4,14 @@ Tests that the sync API wrapper works correctly and provides
 synchronous access to MSF functionality.
 """
 
+import threading
+import time
+import types
+
 import pytest
 
+from assassinate.bridge import sync_api
+
 
 @pytest.mark.integration
 class TestSyncAPI:
@@ -47,6 +53,15 @@ class TestSyncAPI:
         assert len(exploits) > 0
         assert all(isinstance(e, str) for e in exploits)
 
+    def test_sync_framework_list_modules_cached(self, daemon_process):
+        """Test that repeated list_modules calls reuse the cached list."""
+        from assassinate.bridge import Framework
+
+        fw = Framework()
+        first = fw.list_modules("exploit")
+
+        assert fw.list_modules("exploit") is first
+
     def test_sync_framework_search(self, daemon_process):
         """Test sync search."""
         from assassinate.bridge import Framework
@@ -626,3 +641,171 @@ class TestSyncAPI:
 # Note: We don't test mixing sync and async APIs in the same test
 # because it causes event loop conflicts. Each API should be tested
 # separately, and they're tested against the same daemon in different tests.
+
+
+class StubClient:
+    """Stands in for SyncMsfClient, counting the calls made on it."""
+
+    instances: list["StubClient"] = []
+    failed_connects = 0
+
+    def __init__(self):
+        self.calls = []
+        self.catalog_version = 1
+        type(self).instances.append(self)
+
+    def connect(self):
+        self.calls.append("connect")
+        if type(self).failed_connects:
+            type(self).failed_connects -= 1
+            raise RuntimeError("daemon not running")
+        # Widen the window for a second thread to race the first
+        time.sleep(0.01)
+
+    def framework_version(self):
+        self.calls.append("framework_version")
+        return {"version": "6.4.0-dev"}
+
+    def threads(self):
+        self.calls.append("threads")
+        return 4
+
+    def module_catalog_version(self):
+        return self.catalog_version
+
+    def list_modules(self, module_type):
+        self.calls.append(("list_modules", module_type))
+        return [f"{module_type}/v{self.catalog_version}"]
+
+
+@pytest.fixture
+def stub_client(monkeypatch):
+    """Make sync_api build StubClients, starting with no client cached."""
+
+    class Stub(StubClient):
+        instances = []
+
+    monkeypatch.setattr(sync_api, "SyncMsfClient", Stub)
+    monkeypatch.setattr(sync_api, "_client", None)
+    sync_api.get_version.cache_clear()
+    yield Stub
+    sync_api.get_version.cache_clear()
+
+
+@pytest.mark.unit
+class TestGetClient:
+    """Tests for creating the shared sync client."""
+
+    def test_concurrent_callers_share_client(self, stub_client):
+        """Test that threads racing on first use share one client."""
+        barrier = threading.Barrier(8)
+        clients = []
+
+        def worker():
+            barrier.wait()
+            clients.append(sync_api.get_client())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(stub_client.instances) == 1
+        assert clients == stub_client.instances * 8
+
+    def test_failed_connect_is_retried(self, stub_client):
+        """Test that a failed connect is not cached."""
+        stub_client.failed_connects = 1
+        with pytest.raises(RuntimeError):
+            sync_api.get_client()
+
+        client = sync_api.get_client()
+        assert client is sync_api.get_client()
+        assert len(stub_client.instances) == 2
+
+
+@pytest.mark.unit
+class TestVersionCache:
+    """Tests for memoizing the framework version."""
+
+    def test_framework_version_fetched_once(self, stub_client):
+        """Test that version() and repr() share one round-trip."""
+        fw = sync_api.Framework()
+        assert fw.version() == "6.4.0-dev"
+        assert fw.version() == "6.4.0-dev"
+        assert repr(fw) == "<Framework version=6.4.0-dev>"
+        assert fw.get_client().calls.count("framework_version") == 1
+
+    def test_get_version_cache_clear(self, stub_client):
+        """Test that get_version() is memoized until cache_clear()."""
+        client = sync_api.get_client()
+        assert sync_api.get_version() == "6.4.0-dev"
+        assert sync_api.get_version() == "6.4.0-dev"
+        assert client.calls.count("framework_version") == 1
+
+        sync_api.get_version.cache_clear()
+        assert sync_api.get_version() == "6.4.0-dev"
+        assert client.calls.count("framework_version") == 2
+
+
+@pytest.mark.unit
+class TestThreadsCache:
+    """Tests for reusing threads() results in threads_enabled()."""
+
+    def test_threads_enabled_within_ttl(self, stub_client, monkeypatch):
+        """Test that a fresh threads() result is reused until it expires."""
+        now = [100.0]
+        monkeypatch.setattr(
+            sync_api, "time", types.SimpleNamespace(monotonic=lambda: now[0])
+        )
+        fw = sync_api.Framework()
+        client = fw.get_client()
+
+        # threads() fills the cache, so the next check is free
+        assert fw.threads() == 4
+        assert fw.threads_enabled()
+        assert client.calls.count("threads") == 1
+
+        # Still fresh halfway through the TTL
+        now[0] += sync_api.THREADS_CACHE_TTL / 2
+        assert fw.threads_enabled()
+        assert client.calls.count("threads") == 1
+
+        # Expired: another round-trip, which refills the cache
+        now[0] += sync_api.THREADS_CACHE_TTL
+        assert fw.threads_enabled()
+        assert fw.threads_enabled()
+        assert client.calls.count("threads") == 2
+
+
+@pytest.mark.unit
+class TestListModulesCache:
+    """Tests for caching list_modules() per module type."""
+
+    def test_cached_until_catalog_changes(self, stub_client):
+        """Test that results are reused until the catalog version moves."""
+        fw = sync_api.Framework()
+        client = fw.get_client()
+
+        assert fw.list_modules("exploit") == ["exploit/v1"]
+        assert fw.list_modules("exploit") == ["exploit/v1"]
+        assert client.calls.count(("list_modules", "exploit")) == 1
+
+        client.catalog_version = 2
+        assert fw.list_modules("exploit") == ["exploit/v2"]
+        assert client.calls.count(("list_modules", "exploit")) == 2
+
+    def test_types_cached_separately(self, stub_client):
+        """Test that each module type has its own cache entry."""
+        fw = sync_api.Framework()
+        client = fw.get_client()
+
+        assert fw.list_modules("exploit") == ["exploit/v1"]
+        assert fw.list_modules("auxiliary") == ["auxiliary/v1"]
+        assert fw.list_modules("exploit") == ["exploit/v1"]
+        assert fw.list_modules("auxiliary") == ["auxiliary/v1"]
+        assert [c for c in client.calls if c != "connect"] == [
+            ("list_modules", "exploit"),
+            ("list_modules", "auxiliary"),
+        ]
@@ -0,0 +1,161 @@
+"""Unit tests for SyncMsfClient's event loop plumbing.
+
+These run coroutines through the background loop directly, so no daemon
+or shared memory is needed.
+"""
+
+import asyncio
+import gc
+import threading
+import warnings
+import weakref
+
+import pytest
+
+from assassinate.bridge.client_utils import call_client_method
+from assassinate.bridge.sessions import SessionManager
+from assassinate.ipc.sync import SyncMsfClient
+
+
+async def echo(value):
+    """Return ``value`` after yielding to the loop once."""
+    await asyncio.sleep(0)
+    return value
+
+
+@pytest.fixture
+def client():
+    """Create a sync client and stop its background loop afterwards."""
+    client = SyncMsfClient()
+    yield client
+    client._cleanup()
+    if client._loop is not None and not client._loop.is_closed():
+        client._loop.close()
+
+
+@pytest.mark.unit
+class TestRunCoro:
+    """Tests for running coroutines on the background loop."""
+
+    def test_returns_result(self, client):
+        """Test that the coroutine's result is returned."""
+        assert client._run_coro(echo(1)) == 1
+
+    def test_raises_exception(self, client):
+        """Test that an exception in the coroutine is re-raised."""
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            client._run_coro(fail())
+
+    def test_concurrent_callers(self, client):
+        """Test that calls from many threads each get their own result."""
+        results = {}
+
+        def worker(n):
+            results[n] = [client._run_coro(echo((n, i))) for i in range(50)]
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {n: [(n, i) for i in range(50)] for n in range(8)}
+        assert not client._submissions
+
+    def test_call_from_own_loop_raises(self, client):
+        """Test that a call made on the background loop fails fast."""
+
+        async def nested():
+            with pytest.raises(RuntimeError, match="own event loop"):
+                client._run_coro(echo(1))
+            return True
+
+        assert client._run_coro(nested())
+
+    def test_closed_loop_raises_every_call(self, client):
+        """Test that calls after the loop closes raise instead of hanging."""
+        client._run_coro(echo(1))
+        client._cleanup()
+        client._loop.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            client._run_coro(echo(2))
+
+        errors = []
+
+        def call_again():
+            try:
+                client._run_coro(echo(3))
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=call_again, daemon=True)
+        thread.start()
+        thread.join(timeout=2.0)
+        assert not thread.is_alive()
+        assert len(errors) == 1
+        assert not client._submissions
+
+
+class FakeAsyncClient:
+    """Stands in for a connected MsfClient."""
+
+    async def session_info(self, session_id):
+        await asyncio.sleep(0)
+        return {"id": session_id}
+
+    async def list_sessions(self):
+        await asyncio.sleep(0)
+        return [1, 2]
+
+
+@pytest.mark.unit
+class TestBatch:
+    """Tests for SyncMsfClient.batch."""
+
+    def test_results_in_call_order(self, client):
+        """Test that batched method results come back in call order."""
+        client._async_client = FakeAsyncClient()
+        results = client.batch([("session_info", (i,)) for i in range(5)])
+        assert results == [{"id": i} for i in range(5)]
+
+    def test_private_method_rejected(self, client):
+        """Test that only public client methods can be batched."""
+        client._async_client = FakeAsyncClient()
+        with pytest.raises(AttributeError):
+            client.batch([("_call", ("anything",))])
+
+
+@pytest.mark.unit
+class TestBridgeCalls:
+    """Tests for the bridge calling the sync client from a running loop."""
+
+    def test_session_manager(self, client):
+        """Test that SessionManager calls complete without warnings."""
+        client._async_client = FakeAsyncClient()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert SessionManager(client).list() == [1, 2]
+
+    def test_call_client_method(self, client):
+        """Test that call_client_method works without warnings."""
+        client._async_client = FakeAsyncClient()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = asyncio.run(call_client_method(client, "list_sessions"))
+        assert result == [1, 2]
+
+
+@pytest.mark.unit
+class TestLifetime:
+    """Tests for SyncMsfClient cleanup registration."""
+
+    def test_unused_client_is_collected(self):
+        """Test that exit cleanup does not keep dropped clients alive."""
+        ref = weakref.ref(SyncMsfClient())
+        gc.collect()
+        assert ref() is None